@@ -1,15 +1,7 @@
+import io
 import streamlit as st
 import pandas as pd
-import yfinance as yf
-from components.data_loader import DataLoader
-from components.indian_data_loader import IndianDataLoader
-from components.data_processor import DataProcessor
-from components.technical_analysis import TechnicalAnalysis
-from components.comprehensive_technical_analysis import ComprehensiveTechnicalAnalysis
-from components.fundamental_analysis import FundamentalAnalysis
-from components.news_analysis import NewsAnalysis
-from components.simple_candlestick import SimpleCandlestickChart
-from components.utils import format_currency, validate_ticker
+from components.utils import format_currency, validate_ticker, display_dataframe_quickly
 
 # Configure page
 st.set_page_config(
@@ -26,63 +18,256 @@ if 'ticker' not in st.session_state:
     st.session_state.ticker = None
 if 'company_info' not in st.session_state:
     st.session_state.company_info = None
+if 'company_info_lazy' not in st.session_state:
+    st.session_state.company_info_lazy = None
 
-def display_home_page():
-    """Beautiful home page with feature overview"""
+@st.cache_resource
+def get_data_loader():
+    """Shared DataLoader instance"""
+    from components.data_loader import DataLoader
+    return DataLoader()
+
+@st.cache_resource
+def get_indian_loader():
+    """Shared IndianDataLoader instance"""
+    from components.indian_data_loader import IndianDataLoader
+    return IndianDataLoader()
+
+@st.cache_resource
+def get_data_processor():
+    """Shared DataProcessor instance"""
+    from components.data_processor import DataProcessor
+    return DataProcessor()
+
+@st.cache_resource
+def get_technical_analysis():
+    """Shared TechnicalAnalysis instance"""
+    from components.technical_analysis import TechnicalAnalysis
+    return TechnicalAnalysis()
+
+@st.cache_resource
+def get_fundamental_analysis():
+    """Shared FundamentalAnalysis instance"""
+    from components.fundamental_analysis import FundamentalAnalysis
+    return FundamentalAnalysis()
+
+@st.cache_resource
+def get_candlestick_chart():
+    """Shared SimpleCandlestickChart instance"""
+    from components.simple_candlestick import SimpleCandlestickChart
+    return SimpleCandlestickChart()
+
+@st.cache_resource
+def get_news_analysis():
+    """Shared NewsAnalysis instance"""
+    from components.news_analysis import NewsAnalysis
+    return NewsAnalysis()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _process_upload(file_bytes, filename, market_type):
+    """Parse and clean an uploaded file, cached on its content so reruns skip reparsing"""
+    uploaded_file = io.BytesIO(file_bytes)
+    uploaded_file.name = filename
+    return get_data_processor().process_uploaded_data(uploaded_file, market_type)
+
+@st.cache_data(show_spinner=False)
+def _validate_for_charts(df):
+    """Cached chart validation of processed upload data"""
+    return get_data_processor().validate_data_for_charts(df)
+
+def _fetch_yahoo(ticker, period):
+    """Yahoo Finance fetch returning (df, company_info), served from the loader's hourly history and daily info caches"""
+    return get_data_loader().load_from_yahoo(ticker, period)
+
+def _fetch_indian(ticker, period):
+    """Indian ticker fetch returning (df, info_lazy, final_ticker), served from the loader's 5-minute cache"""
+    return get_indian_loader().load_indian_ticker(ticker, period)
+
+def _indian_ticker_suggestions():
+    """Static Indian ticker suggestions (a module constant, so no cache copy is needed)"""
+    return get_indian_loader().get_indian_ticker_suggestions()
+
+# Popular tickers shown when no data is loaded: {category: [(symbol, label)]}
+POPULAR_INDIAN_TICKERS = {
+    "Large Cap": [("RELIANCE", "Oil & Gas"), ("TCS", "IT Services"), ("HDFCBANK", "Banking"), ("INFY", "IT Services")],
+    "Banking & Finance": [("ICICIBANK", None), ("KOTAKBANK", None), ("SBIN", "State Bank"), ("BAJFINANCE", None)],
+    "Other Sectors": [("MARUTI", "Auto"), ("HINDUNILVR", "FMCG"), ("ASIANPAINT", "Paints"), ("TITAN", "Jewellery")]
+}
+
+POPULAR_INTL_TICKERS = {
+    "Tech Stocks": [("AAPL", "Apple"), ("GOOGL", "Google"), ("MSFT", "Microsoft"), ("TSLA", "Tesla")],
+    "Financial": [("JPM", "JPMorgan"), ("BAC", "Bank of America"), ("BRK-A", "Berkshire"), ("V", "Visa")],
+    "Other": [("AMZN", "Amazon"), ("NVDA", "Nvidia"), ("SPY", "S&P 500 ETF"), ("QQQ", "Nasdaq ETF")]
+}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _popular_quotes(symbols):
+    """Latest close for each popular ticker, fetched in batched spark requests"""
+    return get_data_loader().batch_quote(list(symbols))
+
+def _tickers_md(groups, suffix="", currency="$"):
+    """Markdown table of popular tickers, one column per category, with latest close"""
+    symbols = tuple(symbol + suffix for tickers in groups.values() for symbol, _ in tickers)
+    quotes = _popular_quotes(symbols)
+    
+    # Escape "$" so pairs of prices on one row aren't rendered as LaTeX
+    currency = currency.replace("$", "\\$")
+    columns = []
+    for tickers in groups.values():
+        cells = []
+        for symbol, label in tickers:
+            cell = f"{symbol} ({label})" if label else symbol
+            price = quotes.get(symbol + suffix)
+            if price is not None:
+                cell += f" — {currency}{price:,.2f}"
+            cells.append(cell)
+        columns.append(cells)
+    
+    lines = ["| " + " | ".join(f"**{category}**" for category in groups) + " |",
+             "|" + "---|" * len(groups)]
+    for row in zip(*columns):
+        lines.append("| " + " | ".join(row) + " |")
+    return "\n".join(lines)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _indian_tickers_md():
+    """Popular Indian tickers as a markdown table"""
+    return _tickers_md(POPULAR_INDIAN_TICKERS, suffix=".NS", currency="₹")
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _intl_tickers_md():
+    """Popular international tickers as a markdown table"""
+    return _tickers_md(POPULAR_INTL_TICKERS)
+
+@st.cache_resource
+def _indian_sample_df():
+    """Sample of the expected Indian CSV format (read-only, shared without copying)"""
+    return pd.DataFrame({
+        'Date': ['"19-Aug-2025"', '"18-Aug-2025"', '"17-Aug-2025"'],
+        'OPEN': ['"1,390.00"', '"1,390.00"', '"1,387.40"'],
+        'HIGH': ['"1,421.00"', '"1,394.90"', '"1,389.60"'],
+        'LOW': ['"1,389.10"', '"1,377.00"', '"1,373.90"'],
+        'close': ['"1,420.10"', '"1,381.70"', '"1,376.40"'],
+        'VOLUME': ['"1,43,84,719"', '"1,17,85,109"', '"1,02,96,318"']
+    })
+
+@st.cache_resource
+def _intl_sample_df():
+    """Sample of the expected international CSV format (read-only, shared without copying)"""
+    return pd.DataFrame({
+        'Date': ['2024-01-01', '2024-01-02', '2024-01-03'],
+        'Open': [150.00, 151.00, 152.00],
+        'High': [152.00, 153.00, 154.00],
+        'Low': [149.00, 150.00, 151.00],
+        'Close': [151.00, 152.00, 153.00],
+        'Volume': [1000000, 1100000, 1200000]
+    })
+
+@st.cache_data
+def _home_intro_html():
+    """Hero, key features and quick start heading for the home page"""
+    parts = []
+    
     # Hero Section
-    st.markdown("""
-    <div style='text-align: center; padding: 2rem 0; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 15px; margin-bottom: 2rem; color: white;'>
-        <h1 style='font-size: 3rem; margin: 0; font-weight: 600;'>📈 Stock Analysis Dashboard</h1>
-        <p style='font-size: 1.2rem; margin: 1rem 0; opacity: 0.9;'>Advanced technical analysis with real-time insights for Indian and international markets</p>
-    </div>
-    """, unsafe_allow_html=True)
+    parts.append("""<div style='text-align: center; padding: 2rem 0; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 15px; margin-bottom: 2rem; color: white;'>
+    <h1 style='font-size: 3rem; margin: 0; font-weight: 600;'>📈 Stock Analysis Dashboard</h1>
+    <p style='font-size: 1.2rem; margin: 1rem 0; opacity: 0.9;'>Advanced technical analysis with real-time insights for Indian and international markets</p>
+</div>""")
     
     # Key Features Section
-    st.markdown("## 🌟 Key Features")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div style='background: #f8f9fa; padding: 1.5rem; border-radius: 10px; border-left: 4px solid #007bff;'>
-            <h3 style='color: #007bff; margin-top: 0;'>📊 Comprehensive Analysis</h3>
-            <ul style='margin-bottom: 0;'>
-                <li>Advanced candlestick charts</li>
-                <li>Technical indicators (RSI, MACD, Bollinger Bands)</li>
-                <li>Volume and momentum analysis</li>
-                <li>Automated buy/sell signals</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style='background: #f8f9fa; padding: 1.5rem; border-radius: 10px; border-left: 4px solid #28a745;'>
-            <h3 style='color: #28a745; margin-top: 0;'>🌍 Dual Market Support</h3>
-            <ul style='margin-bottom: 0;'>
-                <li>International stocks (Yahoo Finance)</li>
-                <li>Indian market data (NSE/BSE CSV)</li>
-                <li>Real-time data fetching</li>
-                <li>File upload support</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div style='background: #f8f9fa; padding: 1.5rem; border-radius: 10px; border-left: 4px solid #dc3545;'>
-            <h3 style='color: #dc3545; margin-top: 0;'>📈 Smart Insights</h3>
-            <ul style='margin-bottom: 0;'>
-                <li>Fundamental analysis</li>
-                <li>Premium MarketAux news with sentiment</li>
-                <li>Risk assessment</li>
-                <li>Trading recommendations</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+    parts.append("## 🌟 Key Features")
+    
+    key_features = [
+        {
+            "title": "📊 Comprehensive Analysis",
+            "items": ["Advanced candlestick charts", "Technical indicators (RSI, MACD, Bollinger Bands)", "Volume and momentum analysis", "Automated buy/sell signals"],
+            "color": "#007bff"
+        },
+        {
+            "title": "🌍 Dual Market Support",
+            "items": ["International stocks (Yahoo Finance)", "Indian market data (NSE/BSE CSV)", "Real-time data fetching", "File upload support"],
+            "color": "#28a745"
+        },
+        {
+            "title": "📈 Smart Insights",
+            "items": ["Fundamental analysis", "Premium MarketAux news with sentiment", "Risk assessment", "Trading recommendations"],
+            "color": "#dc3545"
+        }
+    ]
+    
+    cards = []
+    for feature in key_features:
+        items = "".join(f"<li>{item}</li>" for item in feature["items"])
+        cards.append(f"""<div style='background: #f8f9fa; padding: 1.5rem; border-radius: 10px; border-left: 4px solid {feature["color"]};'>
+    <h3 style='color: {feature["color"]}; margin-top: 0;'>{feature["title"]}</h3>
+    <ul style='margin-bottom: 0;'>{items}</ul>
+</div>""")
+    parts.append("<div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;'>" + "".join(cards) + "</div>")
     
     # Quick Start Guide
-    st.markdown("## 🚀 Quick Start Guide")
+    parts.append("## 🚀 Quick Start Guide")
+    
+    return "\n\n".join(parts)
+
+@st.cache_data
+def _home_overview_html():
+    """Analysis types, call to action and footer for the home page"""
+    # Analysis Types Overview
+    parts = ["## 📊 Analysis Types Available"]
+    
+    analysis_features = [
+        {
+            "title": "📈 Candlestick Charts",
+            "description": "Interactive price and volume visualization with support/resistance levels",
+            "color": "#007bff"
+        },
+        {
+            "title": "🔍 Comprehensive Technical Analysis", 
+            "description": "Complete suite: RSI, MACD, Bollinger Bands, ATR, VWAP, OBV with automated signals",
+            "color": "#28a745"
+        },
+        {
+            "title": "📋 Fundamental Analysis",
+            "description": "Company financials, ratios, and valuation metrics",
+            "color": "#dc3545"
+        },
+        {
+            "title": "📰 News Analysis",
+            "description": "Latest market news and sentiment analysis",
+            "color": "#ffc107"
+        },
+        {
+            "title": "📊 Market Overview",
+            "description": "Quick snapshot of company metrics and recent performance",
+            "color": "#6f42c1"
+        }
+    ]
+    
+    cards = []
+    for feature in analysis_features:
+        cards.append(f"""<div style='background: white; padding: 1.5rem; border-radius: 10px; border: 1px solid #e9ecef; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+    <h4 style='color: {feature["color"]}; margin-top: 0;'>{feature["title"]}</h4>
+    <p style='margin-bottom: 0; color: #6c757d;'>{feature["description"]}</p>
+</div>""")
+    parts.append("<div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem;'>" + "".join(cards) + "</div>")
+    
+    # Call to Action
+    parts.append("""<div style='background: linear-gradient(135deg, #28a745 0%, #20c997 100%); padding: 2rem; border-radius: 15px; text-align: center; color: white; margin: 2rem 0;'>
+    <h3 style='margin: 0 0 1rem 0;'>Ready to Start Your Analysis?</h3>
+    <p style='margin-bottom: 1.5rem; font-size: 1.1rem; opacity: 0.9;'>Choose your data source from the sidebar and begin exploring powerful stock analysis tools</p>
+    <p style='margin: 0; font-weight: 600;'>👈 Get started with the sidebar controls</p>
+</div>""")
+    
+    # Footer with additional info
+    parts.append("""<div style='text-align: center; padding: 1rem; color: #6c757d; border-top: 1px solid #e9ecef; margin-top: 2rem;'>
+    <small>Built with Streamlit • Powered by Yahoo Finance API, TA-Lib, and Plotly</small>
+</div>""")
+    
+    return "\n\n".join(parts)
+
+def display_home_page():
+    """Beautiful home page with feature overview"""
+    st.markdown(_home_intro_html(), unsafe_allow_html=True)
     
     tab1, tab2 = st.tabs(["📁 Upload File", "🔍 Fetch by Ticker"])
     
@@ -164,65 +349,7 @@ def display_home_page():
             - 1mo, 3mo, 6mo, 1y, 2y, 5y, max
             """)
     
-    # Analysis Types Overview
-    st.markdown("## 📊 Analysis Types Available")
-    
-    analysis_features = [
-        {
-            "title": "📈 Candlestick Charts",
-            "description": "Interactive price and volume visualization with support/resistance levels",
-            "color": "#007bff"
-        },
-        {
-            "title": "🔍 Comprehensive Technical Analysis", 
-            "description": "Complete suite: RSI, MACD, Bollinger Bands, ATR, VWAP, OBV with automated signals",
-            "color": "#28a745"
-        },
-        {
-            "title": "📋 Fundamental Analysis",
-            "description": "Company financials, ratios, and valuation metrics",
-            "color": "#dc3545"
-        },
-        {
-            "title": "📰 News Analysis",
-            "description": "Latest market news and sentiment analysis",
-            "color": "#ffc107"
-        },
-        {
-            "title": "📊 Market Overview",
-            "description": "Quick snapshot of company metrics and recent performance",
-            "color": "#6f42c1"
-        }
-    ]
-    
-    for i in range(0, len(analysis_features), 2):
-        cols = st.columns(2)
-        for j, col in enumerate(cols):
-            if i + j < len(analysis_features):
-                feature = analysis_features[i + j]
-                with col:
-                    st.markdown(f"""
-                    <div style='background: white; padding: 1.5rem; border-radius: 10px; border: 1px solid #e9ecef; margin-bottom: 1rem; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
-                        <h4 style='color: {feature["color"]}; margin-top: 0;'>{feature["title"]}</h4>
-                        <p style='margin-bottom: 0; color: #6c757d;'>{feature["description"]}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-    
-    # Call to Action
-    st.markdown("""
-    <div style='background: linear-gradient(135deg, #28a745 0%, #20c997 100%); padding: 2rem; border-radius: 15px; text-align: center; color: white; margin: 2rem 0;'>
-        <h3 style='margin: 0 0 1rem 0;'>Ready to Start Your Analysis?</h3>
-        <p style='margin-bottom: 1.5rem; font-size: 1.1rem; opacity: 0.9;'>Choose your data source from the sidebar and begin exploring powerful stock analysis tools</p>
-        <p style='margin: 0; font-weight: 600;'>👈 Get started with the sidebar controls</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Footer with additional info
-    st.markdown("""
-    <div style='text-align: center; padding: 1rem; color: #6c757d; border-top: 1px solid #e9ecef; margin-top: 2rem;'>
-        <small>Built with Streamlit • Powered by Yahoo Finance API, TA-Lib, and Plotly</small>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_home_overview_html(), unsafe_allow_html=True)
 
 def main():
     # Check if user has started analysis
@@ -241,6 +368,7 @@ def main():
             st.session_state.data = None
             st.session_state.ticker = None
             st.session_state.company_info = None
+            st.session_state.company_info_lazy = None
             st.rerun()
     
     # Market selection
@@ -255,11 +383,6 @@ def main():
         ["Upload File", "Fetch by Ticker"]
     )
     
-    # Initialize data loaders and processor
-    data_loader = DataLoader()
-    indian_loader = IndianDataLoader()
-    processor = DataProcessor()
-    
     if data_source == "Upload File":
         uploaded_file = st.sidebar.file_uploader(
             f"Upload {market_type} stock data",
@@ -272,19 +395,20 @@ def main():
                 # Show the data first, then process
                 with st.expander("📁 File Processing Details", expanded=True):
                     # Use the robust data processor
-                    df = processor.process_uploaded_data(uploaded_file, market_type)
+                    df = _process_upload(uploaded_file.getvalue(), uploaded_file.name, market_type)
                     
                     # Show processing confirmation
                     st.success("Data processing completed successfully!")
                 
                 # Validate data for charts
-                df = processor.validate_data_for_charts(df)
+                df = _validate_for_charts(df)
                 
                 st.session_state.data = df
-                st.session_state.ticker = st.sidebar.text_input(
+                raw_ticker = st.sidebar.text_input(
                     "Enter ticker symbol (optional):",
                     help="Enter ticker symbol for news and fundamental analysis"
-                ).upper()
+                )
+                st.session_state.ticker = raw_ticker.strip().upper()
                 
                 st.sidebar.success(f"✅ Successfully processed {len(df)} records")
                 
@@ -295,56 +419,73 @@ def main():
     
     else:  # Fetch by Ticker
         if market_type == "Indian Market":
-            ticker_input = st.sidebar.text_input(
-                "Enter Indian stock ticker:",
-                placeholder="e.g., RELIANCE, TCS, HDFCBANK"
-            ).upper()
+            # Form defers reruns until the user submits
+            with st.sidebar.form("indian_fetch_form"):
+                raw_ticker = st.text_input(
+                    "Enter Indian stock ticker:",
+                    placeholder="e.g., RELIANCE, TCS, HDFCBANK"
+                )
+                
+                period = st.selectbox(
+                    "Select time period:",
+                    ["1mo", "3mo", "6mo", "1y", "2y", "5y", "max"],
+                    index=3
+                )
+                
+                submitted = st.form_submit_button("Fetch Indian Stock Data")
             
-            period = st.sidebar.selectbox(
-                "Select time period:",
-                ["1mo", "3mo", "6mo", "1y", "2y", "5y", "max"],
-                index=3
-            )
+            # Normalize the ticker once, on submit
+            ticker_input = raw_ticker.strip().upper() if submitted else ""
             
-            if ticker_input and st.sidebar.button("Fetch Indian Stock Data"):
+            if ticker_input:
                 try:
                     with st.spinner("Fetching Indian stock data..."):
-                        df, company_info, final_ticker = indian_loader.load_indian_ticker(ticker_input, period)
+                        df, info_lazy, final_ticker = _fetch_indian(ticker_input, period)
                         st.session_state.data = df
                         st.session_state.ticker = final_ticker
-                        st.session_state.company_info = company_info
+                        # Company info is only requested once a view shows it
+                        st.session_state.company_info = None
+                        st.session_state.company_info_lazy = info_lazy
                         st.sidebar.success(f"✅ Loaded {len(df)} records for {final_ticker}")
                 except Exception as e:
                     error_msg = str(e)
                     st.sidebar.error(f"❌ Error fetching Indian stock data: {error_msg}")
                     
                     # Show Indian ticker suggestions
-                    suggestions = indian_loader.get_indian_ticker_suggestions()
+                    suggestions = _indian_ticker_suggestions()
                     st.sidebar.info("💡 Try popular Indian tickers:")
                     for category, tickers in suggestions.items():
                         if category != "Indices":  # Skip indices for basic suggestions
                             st.sidebar.write(f"**{category}:** {', '.join([t.replace('.NS', '') for t in tickers[:3]])}")
                     return
         else:
-            ticker_input = st.sidebar.text_input(
-                "Enter stock ticker:",
-                placeholder="e.g., AAPL, GOOGL, MSFT"
-            ).upper()
+            # Form defers reruns until the user submits
+            with st.sidebar.form("fetch_form"):
+                raw_ticker = st.text_input(
+                    "Enter stock ticker:",
+                    placeholder="e.g., AAPL, GOOGL, MSFT"
+                )
+                
+                period = st.selectbox(
+                    "Select time period:",
+                    ["1mo", "3mo", "6mo", "1y", "2y", "5y", "max"],
+                    index=3
+                )
+                
+                submitted = st.form_submit_button("Fetch Data")
             
-            period = st.sidebar.selectbox(
-                "Select time period:",
-                ["1mo", "3mo", "6mo", "1y", "2y", "5y", "max"],
-                index=3
-            )
+            # Normalize the ticker once, on submit
+            ticker_input = raw_ticker.strip().upper() if submitted else ""
             
-            if ticker_input and st.sidebar.button("Fetch Data"):
+            if ticker_input:
                 if validate_ticker(ticker_input):
                     try:
                         with st.spinner("Fetching stock data..."):
-                            df, company_info = data_loader.load_from_yahoo(ticker_input, period)
+                            df, company_info = _fetch_yahoo(ticker_input, period)
                             st.session_state.data = df
                             st.session_state.ticker = ticker_input
                             st.session_state.company_info = company_info
+                            st.session_state.company_info_lazy = None
                             st.sidebar.success(f"✅ Loaded {len(df)} records for {ticker_input}")
                     except Exception as e:
                         error_msg = str(e)
@@ -367,21 +508,10 @@ def main():
         st.sidebar.markdown("---")
         analysis_type = st.sidebar.selectbox(
             "Select Analysis Type:",
-            ["Overview", "Candlestick Chart", "Comprehensive Technical Analysis", "Technical Analysis", "Fundamental Analysis", "News Analysis"]
+            list(ANALYSIS_VIEWS)
         )
         
-        if analysis_type == "Overview":
-            display_overview(df, ticker)
-        elif analysis_type == "Candlestick Chart":
-            display_candlestick_chart(df, ticker, market_type)
-        elif analysis_type == "Comprehensive Technical Analysis":
-            display_comprehensive_technical_analysis(df, ticker)
-        elif analysis_type == "Technical Analysis":
-            display_technical_analysis(df, ticker)
-        elif analysis_type == "Fundamental Analysis":
-            display_fundamental_analysis(ticker)
-        elif analysis_type == "News Analysis":
-            display_news_analysis(ticker)
+        ANALYSIS_VIEWS[analysis_type](df, ticker, market_type)
     else:
         st.info("👆 Please upload a file or enter a ticker symbol to begin analysis")
         
@@ -389,82 +519,32 @@ def main():
         if 'market_type' in locals() and market_type == "Indian Market":
             # Indian market suggestions
             st.markdown("### 💡 Popular Indian Stock Tickers to Try")
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("**Large Cap**")
-                st.write("• RELIANCE (Oil & Gas)")
-                st.write("• TCS (IT Services)")
-                st.write("• HDFCBANK (Banking)")
-                st.write("• INFY (IT Services)")
-                
-            with col2:
-                st.markdown("**Banking & Finance**")
-                st.write("• ICICIBANK")
-                st.write("• KOTAKBANK")
-                st.write("• SBIN (State Bank)")
-                st.write("• BAJFINANCE")
-                
-            with col3:
-                st.markdown("**Other Sectors**")
-                st.write("• MARUTI (Auto)")
-                st.write("• HINDUNILVR (FMCG)")
-                st.write("• ASIANPAINT (Paints)")
-                st.write("• TITAN (Jewellery)")
+            st.markdown(_indian_tickers_md())
             
             # Indian data format sample
             st.markdown("### Expected Indian CSV Data Format")
-            sample_df = pd.DataFrame({
-                'Date': ['"19-Aug-2025"', '"18-Aug-2025"', '"17-Aug-2025"'],
-                'OPEN': ['"1,390.00"', '"1,390.00"', '"1,387.40"'],
-                'HIGH': ['"1,421.00"', '"1,394.90"', '"1,389.60"'],
-                'LOW': ['"1,389.10"', '"1,377.00"', '"1,373.90"'],
-                'close': ['"1,420.10"', '"1,381.70"', '"1,376.40"'],
-                'VOLUME': ['"1,43,84,719"', '"1,17,85,109"', '"1,02,96,318"']
-            })
-            st.dataframe(sample_df, use_container_width=True)
+            st.dataframe(_indian_sample_df(), use_container_width=True)
             
         else:
             # International market suggestions
             st.markdown("### 💡 Popular International Ticker Symbols to Try")
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("**Tech Stocks**")
-                st.write("• AAPL (Apple)")
-                st.write("• GOOGL (Google)")
-                st.write("• MSFT (Microsoft)")
-                st.write("• TSLA (Tesla)")
-                
-            with col2:
-                st.markdown("**Financial**")
-                st.write("• JPM (JPMorgan)")
-                st.write("• BAC (Bank of America)")
-                st.write("• BRK-A (Berkshire)")
-                st.write("• V (Visa)")
-                
-            with col3:
-                st.markdown("**Other**")
-                st.write("• AMZN (Amazon)")
-                st.write("• NVDA (Nvidia)")
-                st.write("• SPY (S&P 500 ETF)")
-                st.write("• QQQ (Nasdaq ETF)")
+            st.markdown(_intl_tickers_md())
             
             # International data format sample
             st.markdown("### Expected International CSV Data Format")
-            sample_df = pd.DataFrame({
-                'Date': ['2024-01-01', '2024-01-02', '2024-01-03'],
-                'Open': [150.00, 151.00, 152.00],
-                'High': [152.00, 153.00, 154.00],
-                'Low': [149.00, 150.00, 151.00],
-                'Close': [151.00, 152.00, 153.00],
-                'Volume': [1000000, 1100000, 1200000]
-            })
-            st.dataframe(sample_df, use_container_width=True)
+            st.dataframe(_intl_sample_df(), use_container_width=True)
 
 def display_overview(df, ticker):
     st.header("📊 Market Overview")
     
+    # Resolve deferred company info (Indian ticker fetches) the first time it is shown
+    if st.session_state.company_info_lazy is not None:
+        info_lazy, st.session_state.company_info_lazy = st.session_state.company_info_lazy, None
+        try:
+            st.session_state.company_info = info_lazy()
+        except Exception as e:
+            st.warning(f"Company info unavailable: {str(e)}")
+    
     if ticker and st.session_state.company_info:
         company_info = st.session_state.company_info
         
@@ -487,25 +567,31 @@ def display_overview(df, ticker):
     
     # Recent data summary
     st.subheader("Recent Performance")
-    recent_data = df.tail(5)
-    st.dataframe(recent_data, use_container_width=True)
+    # Only ship the OHLCV columns to the frontend; uploaded frames can carry many extras
+    display_cols = [col for col in ['Date', 'Open', 'High', 'Low', 'Close', 'Volume'] if col in df.columns]
+    recent_data = df.tail(5)[display_cols].reset_index(drop=True)
+    display_dataframe_quickly(recent_data, use_container_width=True)
     
     # Basic price chart
     st.subheader("Price Movement")
     if not df.empty and 'Close' in df.columns:
-        chart_data = df.set_index('Date')['Close'].dropna()
-        if not chart_data.empty:
-            st.line_chart(chart_data)
+        mask = df['Close'].notna().to_numpy()
+        if mask.any():
+            dates = df['Date'].to_numpy()[mask]
+            closes = df['Close'].to_numpy()[mask]
+            st.line_chart(pd.DataFrame({'Close': closes}, index=dates))
         else:
             st.warning("No valid price data available for chart")
 
 def display_comprehensive_technical_analysis(df, ticker):
     """Display comprehensive technical analysis with all indicators"""
+    from components.comprehensive_technical_analysis import ComprehensiveTechnicalAnalysis
+    
     cta = ComprehensiveTechnicalAnalysis()
     cta.analyze_stock(df)
 
 def display_technical_analysis(df, ticker):
-    ta = TechnicalAnalysis()
+    ta = get_technical_analysis()
     ta.display_analysis(df, ticker)
 
 def display_fundamental_analysis(ticker):
@@ -513,18 +599,18 @@ def display_fundamental_analysis(ticker):
         st.warning("Please provide a ticker symbol for fundamental analysis")
         return
     
-    fa = FundamentalAnalysis()
+    fa = get_fundamental_analysis()
     fa.display_analysis(ticker)
 
 def display_candlestick_chart(df, ticker, market_type):
     """Display candlestick chart with enhanced data processing"""
-    processor = DataProcessor()
-    chart = SimpleCandlestickChart()
+    processor = get_data_processor()
+    chart = get_candlestick_chart()
     
     st.header("📈 Candlestick Chart Analysis")
     
     # Final data validation for charts
-    df_clean = processor.validate_data_for_charts(df.copy())
+    df_clean = processor.validate_data_for_charts(df)
     
     if ticker:
         title = f"{ticker} - Price and Volume Analysis"
@@ -551,8 +637,18 @@ def display_news_analysis(ticker):
         st.warning("Please provide a ticker symbol for news analysis")
         return
     
-    na = NewsAnalysis()
+    na = get_news_analysis()
     na.display_analysis(ticker)
 
+# Analysis type -> view, all called as view(df, ticker, market_type)
+ANALYSIS_VIEWS = {
+    "Overview": lambda df, ticker, market_type: display_overview(df, ticker),
+    "Candlestick Chart": display_candlestick_chart,
+    "Comprehensive Technical Analysis": lambda df, ticker, market_type: display_comprehensive_technical_analysis(df, ticker),
+    "Technical Analysis": lambda df, ticker, market_type: display_technical_analysis(df, ticker),
+    "Fundamental Analysis": lambda df, ticker, market_type: display_fundamental_analysis(ticker),
+    "News Analysis": lambda df, ticker, market_type: display_news_analysis(ticker)
+}
+
 if __name__ == "__main__":
     main()
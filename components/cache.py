@@ -0,0 +1,67 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+
+class FileCache:
+    """Pickle-backed on-disk cache with per-entry TTL that survives app restarts"""
+    def __init__(self, root=CACHE_DIR):
+        self.root = root
+    
+    def _path(self, key):
+        """File path for a cache key such as 'AAPL:info'"""
+        ticker, _, endpoint = key.partition(':')
+        digest = hashlib.md5(key.encode()).hexdigest()[:12]
+        safe_ticker = "".join(ch if ch.isalnum() or ch in ".-^" else "_" for ch in ticker)
+        return os.path.join(self.root, safe_ticker, f"{endpoint or 'value'}-{digest}.pkl")
+    
+    def get(self, key, ttl):
+        """Return the cached value for key, or None if it is missing, stale or unreadable"""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > ttl:
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+            return None
+    
+    def set(self, key, value):
+        """Store a value, writing to a temporary file first so readers never see partial pickles"""
+        path = self._path(key)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PickleError, TypeError, AttributeError):
+            # A read-only disk or unpicklable value only costs us the cache, not the result
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def get_or_fetch(self, key, fetch, ttl=86400):
+        """Return the cached value for key, calling fetch() and storing its result on a miss"""
+        value = self.get(key, ttl)
+        if value is None:
+            value = fetch()
+            # Don't pin an empty response (often a transient Yahoo failure) for the whole TTL
+            if not _is_empty(value):
+                self.set(key, value)
+        return value
+
+def _is_empty(value):
+    """True for None, empty containers and empty DataFrames"""
+    if value is None:
+        return True
+    empty = getattr(value, 'empty', None)
+    if isinstance(empty, bool):
+        return empty
+    try:
+        return len(value) == 0
+    except TypeError:
+        return False
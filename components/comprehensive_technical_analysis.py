@@ -4,12 +4,467 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import numpy as np
-import ta
-from ta.trend import SMAIndicator, EMAIndicator, MACD
-from ta.momentum import RSIIndicator, StochRSIIndicator
-from ta.volatility import BollingerBands, AverageTrueRange
-from ta.volume import OnBalanceVolumeIndicator
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from components import indicator_kernels as kernels
+
+@st.cache_data(show_spinner=False)
+def _calc_moving_averages(df):
+    """SMA 20/50/200 and EMA 20 of the close"""
+    close = df['Close'].to_numpy(np.float64)
+    sma = kernels.sma_all(close, [20, 50, 200])
+    return pd.DataFrame({
+        'SMA_20': sma[20],
+        'SMA_50': sma[50],
+        'SMA_200': sma[200],
+        'EMA_20': kernels.ema(close, 20)
+    }, index=df.index)
+
+@st.cache_data(show_spinner=False)
+def _calc_momentum(df):
+    """RSI, MACD, the stochastic oscillator and the MACD histogram bar colors"""
+    close = df['Close'].to_numpy(np.float64)
+    high = df['High'].to_numpy(np.float64)
+    low = df['Low'].to_numpy(np.float64)
+    macd_line, macd_signal, macd_histogram = kernels.macd(close, fast=12, slow=26, signal=9)
+    stoch_k, stoch_d = kernels.stochastic(high, low, close, k_window=14, d_window=3)
+    return pd.DataFrame({
+        'RSI': kernels.rsi(close, 14),
+        'MACD': macd_line,
+        'MACD_Signal': macd_signal,
+        'MACD_Histogram': macd_histogram,
+        'Stoch_K': stoch_k,
+        'Stoch_D': stoch_d,
+        '_macd_color': np.where(macd_histogram >= 0, 'green', 'red')
+    }, index=df.index)
+
+@st.cache_data(show_spinner=False)
+def _calc_volatility(df):
+    """Bollinger Bands and ATR"""
+    bb_upper, bb_middle, bb_lower = kernels.bollinger(df['Close'].to_numpy(np.float64), 20, 2)
+    return pd.DataFrame({
+        'BB_Upper': bb_upper,
+        'BB_Middle': bb_middle,
+        'BB_Lower': bb_lower,
+        'ATR': kernels.atr(df['High'].to_numpy(np.float64), df['Low'].to_numpy(np.float64),
+                           df['Close'].to_numpy(np.float64), 14)
+    }, index=df.index)
+
+@st.cache_data(show_spinner=False)
+def _calc_volume(df):
+    """OBV, VWAP, the 20-day volume average and volume bar colors, preferring a supplied VWAP"""
+    close = df['Close'].to_numpy(np.float64)
+    volume = df['Volume'].to_numpy()
+    if 'vwap' in df.columns:
+        vwap = df['vwap']
+    else:
+        vwap = kernels.vwap(df['High'].to_numpy(np.float64), df['Low'].to_numpy(np.float64), close, volume)
+    return pd.DataFrame({
+        'OBV': kernels.obv(close, volume),
+        'VWAP': vwap,
+        'Volume_MA': df['Volume'].rolling(window=20).mean(),
+        '_vol_color': np.where(close >= df['Open'].to_numpy(np.float64), 'green', 'red')
+    }, index=df.index)
+
+INDICATOR_GROUPS = {
+    'moving_averages': _calc_moving_averages,
+    'momentum': _calc_momentum,
+    'volatility': _calc_volatility,
+    'volume': _calc_volume
+}
+
+FLOAT32_COLUMNS = [
+    'Open', 'High', 'Low', 'Close', 'SMA_20', 'SMA_50', 'SMA_200', 'EMA_20', 'RSI',
+    'MACD', 'MACD_Signal', 'MACD_Histogram', 'Stoch_K', 'Stoch_D',
+    'BB_Upper', 'BB_Middle', 'BB_Lower', 'ATR', 'VWAP', 'Volume_MA'
+]
+
+# Small in-process LRU of assembled indicator frames, so repeat analyses of the same
+# data skip re-hashing the frame for every cached indicator group
+_ASSEMBLED_CACHE = OrderedDict()
+_ASSEMBLED_CACHE_SIZE = 4
+_assembled_cache_lock = threading.Lock()
+
+def _frame_fingerprint(df):
+    """Cheap content fingerprint of the OHLCV columns"""
+    ohlcv = df[['Date', 'Open', 'High', 'Low', 'Close', 'Volume']]
+    return len(df), tuple(df.columns), int(pd.util.hash_pandas_object(ohlcv, index=False).sum())
+
+def _compute_indicators(df, groups):
+    """Attach the requested indicator groups, reusing recently assembled frames"""
+    key = (_frame_fingerprint(df), groups)
+    with _assembled_cache_lock:
+        if key in _ASSEMBLED_CACHE:
+            _ASSEMBLED_CACHE.move_to_end(key)
+            return _ASSEMBLED_CACHE[key]
+    
+    df_calc = _assemble_indicators(df, groups)
+    if df_calc is not df:
+        with _assembled_cache_lock:
+            _ASSEMBLED_CACHE[key] = df_calc
+            if len(_ASSEMBLED_CACHE) > _ASSEMBLED_CACHE_SIZE:
+                _ASSEMBLED_CACHE.popitem(last=False)
+    return df_calc
+
+def _assemble_indicators(df, groups):
+    """Attach the requested indicator groups; each group is cached on the frame contents"""
+    try:
+        # Normalize dates once to naive datetimes shared by every chart's x-axis
+        dates = pd.to_datetime(df['Date'])
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        
+        # Join the indicator blocks in one concat instead of copying the frame and adding columns
+        # The groups share no intermediate results, so compute them concurrently
+        with ThreadPoolExecutor(max_workers=max(len(groups), 1)) as executor:
+            indicators = list(executor.map(lambda group: INDICATOR_GROUPS[group](df), groups))
+        replaced = [col for block in indicators for col in block.columns if col in df.columns]
+        df_calc = pd.concat([df.drop(columns=replaced).assign(Date=dates)] + indicators, axis=1)
+        
+        # Apply every dtype change in one pass; float32 is ample for display and halves
+        # the bytes Plotly serializes per trace
+        dtypes = {col: 'float32' for col in FLOAT32_COLUMNS if col in df_calc.columns}
+        dtypes['Date'] = 'datetime64[ms]'
+        df_calc = df_calc.astype(dtypes)
+        
+        return df_calc
+        
+    except Exception as e:
+        st.error(f"Error calculating indicators: {str(e)}")
+        return df
+
+def _tail_scalars(df, cols, n=20):
+    """Last n values of each column as plain NumPy arrays, for cheap scalar reads"""
+    return {col: df[col].to_numpy()[-n:] for col in cols}
+
+@st.cache_data(show_spinner=False)
+def _trend_figure(df):
+    """Candlestick chart of the price history"""
+    dates = df['Date'].to_numpy()
+    
+    # Create candlestick chart
+    fig = go.Figure()
+    
+    fig.add_trace(go.Candlestick(
+        x=dates,
+        open=df['Open'],
+        high=df['High'],
+        low=df['Low'],
+        close=df['Close'],
+        name="Price",
+        increasing_line_color='#00ff00',
+        decreasing_line_color='#ff0000'
+    ))
+    
+    fig.update_layout(
+        title="Stock Price Candlestick Chart",
+        xaxis_title="Date",
+        yaxis_title="Price",
+        height=500,
+        xaxis_rangeslider_visible=False
+    )
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _moving_averages_figure(df):
+    """Close price with the SMA 20/50/200 and EMA 20 overlays"""
+    dates = df['Date'].to_numpy()
+    
+    # Create moving averages chart
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['Close'],
+        mode='lines', name='Close Price',
+        line=dict(color='blue', width=2)
+    ))
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['SMA_20'],
+        mode='lines', name='SMA 20',
+        line=dict(color='orange', width=1)
+    ))
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['SMA_50'],
+        mode='lines', name='SMA 50',
+        line=dict(color='red', width=1)
+    ))
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['SMA_200'],
+        mode='lines', name='SMA 200',
+        line=dict(color='purple', width=1)
+    ))
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['EMA_20'],
+        mode='lines', name='EMA 20',
+        line=dict(color='green', width=1, dash='dash')
+    ))
+    
+    fig.update_layout(
+        title="Moving Averages",
+        xaxis_title="Date",
+        yaxis_title="Price",
+        height=400
+    )
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _rsi_figure(df, current_rsi):
+    """RSI line with overbought/oversold guides"""
+    dates = df['Date'].to_numpy()
+    
+    # RSI Chart
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['RSI'],
+        mode='lines', name='RSI',
+        line=dict(color='purple', width=2)
+    ))
+    
+    # Add overbought/oversold lines
+    fig.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought (70)")
+    fig.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold (30)")
+    
+    fig.update_layout(
+        title=f"RSI - Current: {current_rsi:.2f}",
+        xaxis_title="Date",
+        yaxis_title="RSI",
+        height=300,
+        yaxis_range=[0, 100]
+    )
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _macd_figure(df):
+    """MACD and signal lines above the histogram"""
+    dates = df['Date'].to_numpy()
+    
+    # MACD Chart
+    fig = make_subplots(rows=2, cols=1, 
+                       subplot_titles=['MACD Line & Signal', 'MACD Histogram'],
+                       vertical_spacing=0.1, row_heights=[0.6, 0.4])
+    
+    # MACD and Signal lines
+    fig.add_trace(go.Scatter(
+        x=dates, y=df['MACD'],
+        mode='lines', name='MACD',
+        line=dict(color='blue', width=2)
+    ), row=1, col=1)
+    
+    fig.add_trace(go.Scatter(
+        x=dates, y=df['MACD_Signal'],
+        mode='lines', name='Signal',
+        line=dict(color='red', width=2)
+    ), row=1, col=1)
+    
+    # MACD Histogram
+    fig.add_trace(go.Bar(
+        x=dates, y=df['MACD_Histogram'],
+        name='Histogram',
+        marker_color=df['_macd_color']
+    ), row=2, col=1)
+    
+    fig.update_layout(height=400, title="MACD Analysis")
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _stochastic_figure(df, current_k, current_d):
+    """Stochastic %K/%D with overbought/oversold guides"""
+    dates = df['Date'].to_numpy()
+    
+    # Stochastic Chart
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=dates, y=df['Stoch_K'],
+        mode='lines', name='%K',
+        line=dict(color='blue', width=2)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=dates, y=df['Stoch_D'],
+        mode='lines', name='%D',
+        line=dict(color='red', width=2)
+    ))
+    
+    # Add overbought/oversold lines
+    fig.add_hline(y=80, line_dash="dash", line_color="red", annotation_text="Overbought (80)")
+    fig.add_hline(y=20, line_dash="dash", line_color="green", annotation_text="Oversold (20)")
+    
+    fig.update_layout(
+        title=f"Stochastic Oscillator - %K: {current_k:.2f}, %D: {current_d:.2f}",
+        xaxis_title="Date",
+        yaxis_title="Stochastic",
+        height=300,
+        yaxis_range=[0, 100]
+    )
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _bollinger_figure(df):
+    """Close price inside the Bollinger Bands"""
+    dates = df['Date'].to_numpy()
+    
+    # Bollinger Bands Chart
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['Close'],
+        mode='lines', name='Close Price',
+        line=dict(color='blue', width=2)
+    ))
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['BB_Upper'],
+        mode='lines', name='Upper Band',
+        line=dict(color='red', width=1),
+        fill=None
+    ))
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['BB_Lower'],
+        mode='lines', name='Lower Band',
+        line=dict(color='red', width=1),
+        fill='tonexty', fillcolor='rgba(255,0,0,0.1)'
+    ))
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['BB_Middle'],
+        mode='lines', name='Middle Band (SMA 20)',
+        line=dict(color='orange', width=1, dash='dash')
+    ))
+    
+    fig.update_layout(
+        title="Bollinger Bands",
+        xaxis_title="Date",
+        yaxis_title="Price",
+        height=400
+    )
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _atr_figure(df, current_atr, atr_percentage):
+    """Average True Range line"""
+    dates = df['Date'].to_numpy()
+    
+    # ATR Chart
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['ATR'],
+        mode='lines', name='ATR',
+        line=dict(color='purple', width=2)
+    ))
+    
+    fig.update_layout(
+        title=f"Average True Range - Current: {current_atr:.2f} ({atr_percentage:.2f}%)",
+        xaxis_title="Date",
+        yaxis_title="ATR",
+        height=300
+    )
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _volume_figure(df):
+    """Price above colored volume bars and their 20-day average"""
+    dates = df['Date'].to_numpy()
+    
+    fig = make_subplots(rows=2, cols=1, 
+                       subplot_titles=['Price', 'Volume'],
+                       vertical_spacing=0.1, row_heights=[0.6, 0.4])
+    
+    # Price chart
+    fig.add_trace(go.Scatter(
+        x=dates, y=df['Close'],
+        mode='lines', name='Price',
+        line=dict(color='blue', width=2)
+    ), row=1, col=1)
+    
+    # Volume bars
+    fig.add_trace(go.Bar(
+        x=dates, y=df['Volume'],
+        name='Volume',
+        marker_color=df['_vol_color']
+    ), row=2, col=1)
+    
+    # Volume MA
+    fig.add_trace(go.Scatter(
+        x=dates, y=df['Volume_MA'],
+        mode='lines', name='Volume MA (20)',
+        line=dict(color='orange', width=2)
+    ), row=2, col=1)
+    
+    fig.update_layout(height=500, title="Price and Volume Analysis")
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _vwap_figure(df):
+    """Close price against VWAP"""
+    dates = df['Date'].to_numpy()
+    
+    # VWAP Chart
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['Close'],
+        mode='lines', name='Close Price',
+        line=dict(color='blue', width=2)
+    ))
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['VWAP'],
+        mode='lines', name='VWAP',
+        line=dict(color='red', width=2)
+    ))
+    
+    fig.update_layout(
+        title="Price vs VWAP",
+        xaxis_title="Date",
+        yaxis_title="Price",
+        height=300
+    )
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _obv_figure(df):
+    """Price above On-Balance Volume"""
+    dates = df['Date'].to_numpy()
+    
+    # OBV Chart
+    fig = make_subplots(rows=2, cols=1,
+                       subplot_titles=['Price', 'OBV'],
+                       vertical_spacing=0.1)
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['Close'],
+        mode='lines', name='Price',
+        line=dict(color='blue', width=2)
+    ), row=1, col=1)
+    
+    fig.add_trace(go.Scattergl(
+        x=dates, y=df['OBV'],
+        mode='lines', name='OBV',
+        line=dict(color='green', width=2)
+    ), row=2, col=1)
+    
+    fig.update_layout(height=400, title="Price vs OBV")
+    
+    return fig
 
 class ComprehensiveTechnicalAnalysis:
     def __init__(self):
@@ -31,122 +486,50 @@ class ComprehensiveTechnicalAnalysis:
         
         st.header("📊 Comprehensive Technical Analysis")
         
-        # Calculate all indicators
-        df_analysis = self._calculate_all_indicators(df)
-        
-        # Create tabs for different analysis types
-        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+
+        # Only the selected view runs; st.tabs would execute and serialize all six on every rerun
+        active_view = st.radio("Analysis view:", [
             "📈 Trend Analysis", 
             "📉 Moving Averages", 
             "⚡ Momentum", 
             "📊 Volatility", 
             "🔊 Volume Analysis", 
             "🎯 Signals & Summary"
-        ])
-        
-        with tab1:
-            self._trend_analysis(df_analysis)
-        
-        with tab2:
-            self._moving_averages_analysis(df_analysis)
-        
-        with tab3:
-            self._momentum_analysis(df_analysis)
-        
-        with tab4:
-            self._volatility_analysis(df_analysis)
-        
-        with tab5:
-            self._volume_analysis(df_analysis)
-        
-        with tab6:
-            self._signals_and_summary(df_analysis)
-    
-    def _calculate_all_indicators(self, df):
-        """Calculate all technical indicators"""
-        df_calc = df.copy()
-        
-        try:
-            # Moving Averages
-            sma_20 = SMAIndicator(close=df_calc['Close'], window=20)
-            sma_50 = SMAIndicator(close=df_calc['Close'], window=50)
-            sma_200 = SMAIndicator(close=df_calc['Close'], window=200)
-            ema_20 = EMAIndicator(close=df_calc['Close'], window=20)
-            
-            df_calc['SMA_20'] = sma_20.sma_indicator()
-            df_calc['SMA_50'] = sma_50.sma_indicator()
-            df_calc['SMA_200'] = sma_200.sma_indicator()
-            df_calc['EMA_20'] = ema_20.ema_indicator()
-            
-            # Momentum Indicators
-            rsi = RSIIndicator(close=df_calc['Close'], window=14)
-            df_calc['RSI'] = rsi.rsi()
-            
-            macd = MACD(close=df_calc['Close'], window_slow=26, window_fast=12, window_sign=9)
-            df_calc['MACD'] = macd.macd()
-            df_calc['MACD_Signal'] = macd.macd_signal()
-            df_calc['MACD_Histogram'] = macd.macd_diff()
-            
-            # Stochastic Oscillator - using simple calculation
-            stoch_k = ((df_calc['Close'] - df_calc['Low'].rolling(window=14).min()) / 
-                      (df_calc['High'].rolling(window=14).max() - df_calc['Low'].rolling(window=14).min())) * 100
-            df_calc['Stoch_K'] = stoch_k
-            df_calc['Stoch_D'] = stoch_k.rolling(window=3).mean()
-            
-            # Bollinger Bands
-            bb = BollingerBands(close=df_calc['Close'], window=20, window_dev=2)
-            df_calc['BB_Upper'] = bb.bollinger_hband()
-            df_calc['BB_Middle'] = bb.bollinger_mavg()
-            df_calc['BB_Lower'] = bb.bollinger_lband()
-            
-            # ATR
-            atr = AverageTrueRange(high=df_calc['High'], low=df_calc['Low'], close=df_calc['Close'], window=14)
-            df_calc['ATR'] = atr.average_true_range()
-            
-            # Volume indicators
-            obv = OnBalanceVolumeIndicator(close=df_calc['Close'], volume=df_calc['Volume'])
-            df_calc['OBV'] = obv.on_balance_volume()
-            
-            # VWAP calculation
-            if 'vwap' in df.columns:
-                # Use existing VWAP if available
-                df_calc['VWAP'] = df['vwap']
-            else:
-                # Calculate VWAP
-                df_calc['VWAP'] = (df_calc['Volume'] * (df_calc['High'] + df_calc['Low'] + df_calc['Close']) / 3).cumsum() / df_calc['Volume'].cumsum()
+        ], horizontal=True, key="comprehensive_analysis_view")
+        
+        # Each view only computes the indicator groups it displays
+        if active_view == "📈 Trend Analysis":
+            self._trend_analysis(self._calculate_indicators(df))
+        elif active_view == "📉 Moving Averages":
+            self._moving_averages_analysis(self._calculate_indicators(df, 'moving_averages'))
+        elif active_view == "⚡ Momentum":
+            self._momentum_analysis(self._calculate_indicators(df, 'momentum'))
+        elif active_view == "📊 Volatility":
+            self._volatility_analysis(self._calculate_indicators(df, 'volatility'))
+        elif active_view == "🔊 Volume Analysis":
+            self._volume_analysis(self._calculate_indicators(df, 'volume'))
+        else:
+            df_analysis = self._calculate_indicators(df, *INDICATOR_GROUPS)
             
-            return df_calc
+            # Signals are collected by the individual analyses, so run them all before summarizing
+            with st.expander("Supporting analyses", expanded=False):
+                self._trend_analysis(df_analysis)
+                self._moving_averages_analysis(df_analysis)
+                self._momentum_analysis(df_analysis)
+                self._volatility_analysis(df_analysis)
+                self._volume_analysis(df_analysis)
             
-        except Exception as e:
-            st.error(f"Error calculating indicators: {str(e)}")
-            return df
+            self._signals_and_summary(df_analysis)
+    
+    def _calculate_indicators(self, df, *groups):
+        """Calculate the requested groups of technical indicators"""
+        return _compute_indicators(df, groups)
     
     def _trend_analysis(self, df):
         """Trend analysis with candlestick chart"""
         st.subheader("📈 Candlestick Chart & Trend Analysis")
         
-        # Create candlestick chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Candlestick(
-            x=df['Date'],
-            open=df['Open'],
-            high=df['High'],
-            low=df['Low'],
-            close=df['Close'],
-            name="Price",
-            increasing_line_color='#00ff00',
-            decreasing_line_color='#ff0000'
-        ))
-        
-        fig.update_layout(
-            title="Stock Price Candlestick Chart",
-            xaxis_title="Date",
-            yaxis_title="Price",
-            height=500,
-            xaxis_rangeslider_visible=False
-        )
-        
+        fig = _trend_figure(df)
         st.plotly_chart(fig, use_container_width=True)
         
         # Support/Resistance Analysis
@@ -160,26 +543,29 @@ class ComprehensiveTechnicalAnalysis:
         st.subheader("🎯 Support & Resistance Levels")
         
         # Calculate recent highs and lows
-        recent_data = df.tail(50)  # Last 50 days
-        
-        # Find local maxima and minima
-        highs = recent_data['High'].rolling(window=5, center=True).max()
-        lows = recent_data['Low'].rolling(window=5, center=True).min()
-        
-        resistance_levels = recent_data[recent_data['High'] == highs]['High'].unique()
-        support_levels = recent_data[recent_data['Low'] == lows]['Low'].unique()
+        recent_high = df['High'].to_numpy()[-50:]  # Last 50 days
+        recent_low = df['Low'].to_numpy()[-50:]
+        
+        # Find local maxima and minima: points that are the extreme of their centered 5-day window
+        resistance_levels = np.array([])
+        support_levels = np.array([])
+        if len(recent_high) >= 5:
+            high_windows = np.lib.stride_tricks.sliding_window_view(recent_high, 5)
+            low_windows = np.lib.stride_tricks.sliding_window_view(recent_low, 5)
+            resistance_levels = np.unique(recent_high[2:-2][recent_high[2:-2] == high_windows.max(axis=1)])
+            support_levels = np.unique(recent_low[2:-2][recent_low[2:-2] == low_windows.min(axis=1)])
         
         # Display levels
         col1, col2 = st.columns(2)
         
         with col1:
             st.write("**Resistance Levels (Recent Highs):**")
-            for level in sorted(resistance_levels, reverse=True)[:3]:
+            for level in resistance_levels[::-1][:3]:
                 st.write(f"• ₹{level:.2f}")
         
         with col2:
             st.write("**Support Levels (Recent Lows):**")
-            for level in sorted(support_levels)[:3]:
+            for level in support_levels[:3]:
                 st.write(f"• ₹{level:.2f}")
     
     def _fifty_two_week_analysis(self, df):
@@ -227,46 +613,7 @@ class ComprehensiveTechnicalAnalysis:
         """Moving averages analysis"""
         st.subheader("📉 Moving Averages Analysis")
         
-        # Create moving averages chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['Close'],
-            mode='lines', name='Close Price',
-            line=dict(color='blue', width=2)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['SMA_20'],
-            mode='lines', name='SMA 20',
-            line=dict(color='orange', width=1)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['SMA_50'],
-            mode='lines', name='SMA 50',
-            line=dict(color='red', width=1)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['SMA_200'],
-            mode='lines', name='SMA 200',
-            line=dict(color='purple', width=1)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['EMA_20'],
-            mode='lines', name='EMA 20',
-            line=dict(color='green', width=1, dash='dash')
-        ))
-        
-        fig.update_layout(
-            title="Moving Averages",
-            xaxis_title="Date",
-            yaxis_title="Price",
-            height=400
-        )
-        
+        fig = _moving_averages_figure(df)
         st.plotly_chart(fig, use_container_width=True)
         
         # Golden Cross / Death Cross Analysis
@@ -276,13 +623,12 @@ class ComprehensiveTechnicalAnalysis:
         """Analyze Golden Cross and Death Cross"""
         st.subheader("✨ Golden Cross / Death Cross Analysis")
         
-        # Check recent crossovers
-        recent_data = df.tail(10)
+        tail = _tail_scalars(df, ['SMA_50', 'SMA_200', 'Close', 'SMA_20'])
         
         # Golden Cross: SMA 50 crosses above SMA 200
-        if len(recent_data) > 1:
-            prev_50_above_200 = recent_data['SMA_50'].iloc[-2] > recent_data['SMA_200'].iloc[-2]
-            curr_50_above_200 = recent_data['SMA_50'].iloc[-1] > recent_data['SMA_200'].iloc[-1]
+        if len(df) > 1:
+            prev_50_above_200 = tail['SMA_50'][-2] > tail['SMA_200'][-2]
+            curr_50_above_200 = tail['SMA_50'][-1] > tail['SMA_200'][-1]
             
             if not prev_50_above_200 and curr_50_above_200:
                 st.success("🟢 GOLDEN CROSS: SMA 50 crossed above SMA 200 - Bullish Signal!")
@@ -294,10 +640,10 @@ class ComprehensiveTechnicalAnalysis:
                 self.summary_points.append("Death Cross bearish signal")
         
         # Current MA alignment
-        current_close = df['Close'].iloc[-1]
-        current_sma_20 = df['SMA_20'].iloc[-1]
-        current_sma_50 = df['SMA_50'].iloc[-1]
-        current_sma_200 = df['SMA_200'].iloc[-1]
+        current_close = tail['Close'][-1]
+        current_sma_20 = tail['SMA_20'][-1]
+        current_sma_50 = tail['SMA_50'][-1]
+        current_sma_200 = tail['SMA_200'][-1]
         
         col1, col2 = st.columns(2)
         
@@ -335,29 +681,11 @@ class ComprehensiveTechnicalAnalysis:
         """RSI analysis and chart"""
         st.subheader("📊 RSI (Relative Strength Index)")
         
-        current_rsi = df['RSI'].iloc[-1]
-        
-        # RSI Chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['RSI'],
-            mode='lines', name='RSI',
-            line=dict(color='purple', width=2)
-        ))
+        tail = _tail_scalars(df, ['RSI'])
         
-        # Add overbought/oversold lines
-        fig.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought (70)")
-        fig.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold (30)")
-        
-        fig.update_layout(
-            title=f"RSI - Current: {current_rsi:.2f}",
-            xaxis_title="Date",
-            yaxis_title="RSI",
-            height=300,
-            yaxis_range=[0, 100]
-        )
+        current_rsi = tail['RSI'][-1]
         
+        fig = _rsi_figure(df, current_rsi)
         st.plotly_chart(fig, use_container_width=True)
         
         # RSI Interpretation
@@ -381,7 +709,7 @@ class ComprehensiveTechnicalAnalysis:
         
         with col3:
             # RSI trend
-            rsi_5_days_ago = df['RSI'].iloc[-6] if len(df) >= 6 else current_rsi
+            rsi_5_days_ago = tail['RSI'][-6] if len(df) >= 6 else current_rsi
             rsi_trend = "Rising" if current_rsi > rsi_5_days_ago else "Falling"
             st.write(f"**5-day trend:** {rsi_trend}")
     
@@ -389,39 +717,15 @@ class ComprehensiveTechnicalAnalysis:
         """MACD analysis and chart"""
         st.subheader("📈 MACD Analysis")
         
-        # MACD Chart
-        fig = make_subplots(rows=2, cols=1, 
-                           subplot_titles=['MACD Line & Signal', 'MACD Histogram'],
-                           vertical_spacing=0.1, row_heights=[0.6, 0.4])
-        
-        # MACD and Signal lines
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['MACD'],
-            mode='lines', name='MACD',
-            line=dict(color='blue', width=2)
-        ), row=1, col=1)
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['MACD_Signal'],
-            mode='lines', name='Signal',
-            line=dict(color='red', width=2)
-        ), row=1, col=1)
-        
-        # MACD Histogram
-        colors = ['green' if val >= 0 else 'red' for val in df['MACD_Histogram']]
-        fig.add_trace(go.Bar(
-            x=df['Date'], y=df['MACD_Histogram'],
-            name='Histogram',
-            marker_color=colors
-        ), row=2, col=1)
+        tail = _tail_scalars(df, ['MACD', 'MACD_Signal', 'MACD_Histogram'])
         
-        fig.update_layout(height=400, title="MACD Analysis")
+        fig = _macd_figure(df)
         st.plotly_chart(fig, use_container_width=True)
         
         # MACD Signal Analysis
-        current_macd = df['MACD'].iloc[-1]
-        current_signal = df['MACD_Signal'].iloc[-1]
-        current_histogram = df['MACD_Histogram'].iloc[-1]
+        current_macd = tail['MACD'][-1]
+        current_signal = tail['MACD_Signal'][-1]
+        current_histogram = tail['MACD_Histogram'][-1]
         
         col1, col2, col3 = st.columns(3)
         
@@ -436,8 +740,8 @@ class ComprehensiveTechnicalAnalysis:
         
         # MACD Crossover Analysis
         if len(df) > 1:
-            prev_macd = df['MACD'].iloc[-2]
-            prev_signal = df['MACD_Signal'].iloc[-2]
+            prev_macd = tail['MACD'][-2]
+            prev_signal = tail['MACD_Signal'][-2]
             
             if prev_macd <= prev_signal and current_macd > current_signal:
                 st.success("🟢 MACD Bullish Crossover - Buy Signal!")
@@ -455,36 +759,12 @@ class ComprehensiveTechnicalAnalysis:
         """Stochastic oscillator analysis"""
         st.subheader("🎯 Stochastic Oscillator")
         
-        current_k = df['Stoch_K'].iloc[-1]
-        current_d = df['Stoch_D'].iloc[-1]
+        tail = _tail_scalars(df, ['Stoch_K', 'Stoch_D'])
         
-        # Stochastic Chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['Stoch_K'],
-            mode='lines', name='%K',
-            line=dict(color='blue', width=2)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['Stoch_D'],
-            mode='lines', name='%D',
-            line=dict(color='red', width=2)
-        ))
-        
-        # Add overbought/oversold lines
-        fig.add_hline(y=80, line_dash="dash", line_color="red", annotation_text="Overbought (80)")
-        fig.add_hline(y=20, line_dash="dash", line_color="green", annotation_text="Oversold (20)")
-        
-        fig.update_layout(
-            title=f"Stochastic Oscillator - %K: {current_k:.2f}, %D: {current_d:.2f}",
-            xaxis_title="Date",
-            yaxis_title="Stochastic",
-            height=300,
-            yaxis_range=[0, 100]
-        )
+        current_k = tail['Stoch_K'][-1]
+        current_d = tail['Stoch_D'][-1]
         
+        fig = _stochastic_figure(df, current_k, current_d)
         st.plotly_chart(fig, use_container_width=True)
         
         # Stochastic Signal Analysis
@@ -520,49 +800,16 @@ class ComprehensiveTechnicalAnalysis:
         """Bollinger Bands analysis"""
         st.subheader("📈 Bollinger Bands")
         
-        # Bollinger Bands Chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['Close'],
-            mode='lines', name='Close Price',
-            line=dict(color='blue', width=2)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['BB_Upper'],
-            mode='lines', name='Upper Band',
-            line=dict(color='red', width=1),
-            fill=None
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['BB_Lower'],
-            mode='lines', name='Lower Band',
-            line=dict(color='red', width=1),
-            fill='tonexty', fillcolor='rgba(255,0,0,0.1)'
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['BB_Middle'],
-            mode='lines', name='Middle Band (SMA 20)',
-            line=dict(color='orange', width=1, dash='dash')
-        ))
-        
-        fig.update_layout(
-            title="Bollinger Bands",
-            xaxis_title="Date",
-            yaxis_title="Price",
-            height=400
-        )
+        tail = _tail_scalars(df, ['Close', 'BB_Upper', 'BB_Lower', 'BB_Middle'])
         
+        fig = _bollinger_figure(df)
         st.plotly_chart(fig, use_container_width=True)
         
         # BB Analysis
-        current_close = df['Close'].iloc[-1]
-        current_upper = df['BB_Upper'].iloc[-1]
-        current_lower = df['BB_Lower'].iloc[-1]
-        current_middle = df['BB_Middle'].iloc[-1]
+        current_close = tail['Close'][-1]
+        current_upper = tail['BB_Upper'][-1]
+        current_lower = tail['BB_Lower'][-1]
+        current_middle = tail['BB_Middle'][-1]
         
         bb_position = ((current_close - current_lower) / (current_upper - current_lower)) * 100
         
@@ -595,26 +842,13 @@ class ComprehensiveTechnicalAnalysis:
         """ATR analysis"""
         st.subheader("📊 Average True Range (ATR)")
         
-        current_atr = df['ATR'].iloc[-1]
-        current_price = df['Close'].iloc[-1]
-        atr_percentage = (current_atr / current_price) * 100
-        
-        # ATR Chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['ATR'],
-            mode='lines', name='ATR',
-            line=dict(color='purple', width=2)
-        ))
+        tail = _tail_scalars(df, ['ATR', 'Close'])
         
-        fig.update_layout(
-            title=f"Average True Range - Current: {current_atr:.2f} ({atr_percentage:.2f}%)",
-            xaxis_title="Date",
-            yaxis_title="ATR",
-            height=300
-        )
+        current_atr = tail['ATR'][-1]
+        current_price = tail['Close'][-1]
+        atr_percentage = (current_atr / current_price) * 100
         
+        fig = _atr_figure(df, current_atr, atr_percentage)
         st.plotly_chart(fig, use_container_width=True)
         
         col1, col2, col3 = st.columns(3)
@@ -627,7 +861,7 @@ class ComprehensiveTechnicalAnalysis:
         
         with col3:
             # ATR trend
-            atr_10_days_ago = df['ATR'].iloc[-11] if len(df) >= 11 else current_atr
+            atr_10_days_ago = tail['ATR'][-11] if len(df) >= 11 else current_atr
             atr_trend = "Rising" if current_atr > atr_10_days_ago else "Falling"
             st.write(f"**10-day trend:** {atr_trend}")
         
@@ -661,41 +895,14 @@ class ComprehensiveTechnicalAnalysis:
         """Volume trend chart"""
         st.subheader("📊 Volume Trend")
         
-        # Calculate volume moving average
-        df['Volume_MA'] = df['Volume'].rolling(window=20).mean()
-        
-        fig = make_subplots(rows=2, cols=1, 
-                           subplot_titles=['Price', 'Volume'],
-                           vertical_spacing=0.1, row_heights=[0.6, 0.4])
+        tail = _tail_scalars(df, ['Volume', 'Volume_MA'])
         
-        # Price chart
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['Close'],
-            mode='lines', name='Price',
-            line=dict(color='blue', width=2)
-        ), row=1, col=1)
-        
-        # Volume bars
-        colors = ['green' if df['Close'].iloc[i] >= df['Open'].iloc[i] else 'red' for i in range(len(df))]
-        fig.add_trace(go.Bar(
-            x=df['Date'], y=df['Volume'],
-            name='Volume',
-            marker_color=colors
-        ), row=2, col=1)
-        
-        # Volume MA
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['Volume_MA'],
-            mode='lines', name='Volume MA (20)',
-            line=dict(color='orange', width=2)
-        ), row=2, col=1)
-        
-        fig.update_layout(height=500, title="Price and Volume Analysis")
+        fig = _volume_figure(df)
         st.plotly_chart(fig, use_container_width=True)
         
         # Volume analysis
-        current_volume = df['Volume'].iloc[-1]
-        avg_volume = df['Volume'].rolling(window=20).mean().iloc[-1]
+        current_volume = tail['Volume'][-1]
+        avg_volume = tail['Volume_MA'][-1]
         volume_ratio = current_volume / avg_volume
         
         col1, col2, col3 = st.columns(3)
@@ -720,31 +927,12 @@ class ComprehensiveTechnicalAnalysis:
         """VWAP analysis"""
         st.subheader("📈 Volume Weighted Average Price (VWAP)")
         
-        current_close = df['Close'].iloc[-1]
-        current_vwap = df['VWAP'].iloc[-1]
-        
-        # VWAP Chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['Close'],
-            mode='lines', name='Close Price',
-            line=dict(color='blue', width=2)
-        ))
+        tail = _tail_scalars(df, ['Close', 'VWAP'])
         
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['VWAP'],
-            mode='lines', name='VWAP',
-            line=dict(color='red', width=2)
-        ))
-        
-        fig.update_layout(
-            title="Price vs VWAP",
-            xaxis_title="Date",
-            yaxis_title="Price",
-            height=300
-        )
+        current_close = tail['Close'][-1]
+        current_vwap = tail['VWAP'][-1]
         
+        fig = _vwap_figure(df)
         st.plotly_chart(fig, use_container_width=True)
         
         col1, col2, col3 = st.columns(3)
@@ -771,33 +959,18 @@ class ComprehensiveTechnicalAnalysis:
         """On-Balance Volume analysis"""
         st.subheader("📊 On-Balance Volume (OBV)")
         
-        # OBV Chart
-        fig = make_subplots(rows=2, cols=1,
-                           subplot_titles=['Price', 'OBV'],
-                           vertical_spacing=0.1)
-        
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['Close'],
-            mode='lines', name='Price',
-            line=dict(color='blue', width=2)
-        ), row=1, col=1)
+        tail = _tail_scalars(df, ['OBV', 'Close'])
         
-        fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['OBV'],
-            mode='lines', name='OBV',
-            line=dict(color='green', width=2)
-        ), row=2, col=1)
-        
-        fig.update_layout(height=400, title="Price vs OBV")
+        fig = _obv_figure(df)
         st.plotly_chart(fig, use_container_width=True)
         
         # OBV Trend Analysis
-        current_obv = df['OBV'].iloc[-1]
-        obv_10_days_ago = df['OBV'].iloc[-11] if len(df) >= 11 else current_obv
+        current_obv = tail['OBV'][-1]
+        obv_10_days_ago = tail['OBV'][-11] if len(df) >= 11 else current_obv
         obv_trend = "Rising" if current_obv > obv_10_days_ago else "Falling"
         
-        price_10_days_ago = df['Close'].iloc[-11] if len(df) >= 11 else df['Close'].iloc[-1]
-        price_trend = "Rising" if df['Close'].iloc[-1] > price_10_days_ago else "Falling"
+        price_10_days_ago = tail['Close'][-11] if len(df) >= 11 else tail['Close'][-1]
+        price_trend = "Rising" if tail['Close'][-1] > price_10_days_ago else "Falling"
         
         col1, col2, col3 = st.columns(3)
         
@@ -834,20 +1007,23 @@ class ComprehensiveTechnicalAnalysis:
         
         st.subheader("💧 Liquidity Analysis")
         
-        current_trades = df['Nooftrades'].iloc[-1]
-        avg_trades = df['Nooftrades'].rolling(window=20).mean().iloc[-1]
+        trades = df['Nooftrades'].to_numpy(dtype=np.float64)
+        trades_ma = kernels.sma_all(trades, [20])[20]
+        current_trades = trades[-1]
+        avg_trades = trades_ma[-1]
         
         # Trades Chart
+        dates = df['Date'].to_numpy()
         fig = go.Figure()
         
         fig.add_trace(go.Bar(
-            x=df['Date'], y=df['Nooftrades'],
+            x=dates, y=trades,
             name='Number of Trades',
             marker_color='lightblue'
         ))
         
         fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['Nooftrades'].rolling(window=20).mean(),
+            x=dates, y=trades_ma,
             mode='lines', name='20-day Average',
             line=dict(color='red', width=2)
         ))
@@ -884,29 +1060,40 @@ class ComprehensiveTechnicalAnalysis:
         """Generate final signals and summary"""
         st.subheader("🎯 Trading Signals & Summary")
         
-        # Compile all signals
-        buy_signals = [s for s in self.signals if s.startswith("BUY")]
-        sell_signals = [s for s in self.signals if s.startswith("SELL")]
+        # Fetch the latest indicator readings as one small row rather than per-column lookups
+        current_price, current_rsi, current_macd, current_signal, current_atr = (
+            df.tail(1)[['Close', 'RSI', 'MACD', 'MACD_Signal', 'ATR']].to_numpy()[0]
+        )
+        
+        # Compile all signals in one partitioning pass
+        buy_signals, sell_signals = [], []
+        for signal in self.signals:
+            if signal[:3] == "BUY":
+                buy_signals.append(signal)
+            elif signal[:4] == "SELL":
+                sell_signals.append(signal)
+        n_buy, n_sell = len(buy_signals), len(sell_signals)
         
         # Overall Signal
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.write(f"**Buy Signals: {len(buy_signals)}**")
-            for signal in buy_signals:
-                st.success(f"✅ {signal}")
+            st.write(f"**Buy Signals: {n_buy}**")
+            if buy_signals:
+                # One banner for all signals; the trailing double space makes a markdown line break
+                st.success("  \n".join(f"✅ {signal}" for signal in buy_signals))
         
         with col2:
-            st.write(f"**Sell Signals: {len(sell_signals)}**")
-            for signal in sell_signals:
-                st.error(f"❌ {signal}")
+            st.write(f"**Sell Signals: {n_sell}**")
+            if sell_signals:
+                st.error("  \n".join(f"❌ {signal}" for signal in sell_signals))
         
         with col3:
             # Overall recommendation
-            if len(buy_signals) > len(sell_signals):
+            if n_buy > n_sell:
                 overall_signal = "BUY"
                 signal_color = "success"
-            elif len(sell_signals) > len(buy_signals):
+            elif n_sell > n_buy:
                 overall_signal = "SELL"
                 signal_color = "error"
             else:
@@ -923,11 +1110,6 @@ class ComprehensiveTechnicalAnalysis:
         # Market Condition Summary
         st.subheader("📋 Market Condition Summary")
         
-        current_price = df['Close'].iloc[-1]
-        current_rsi = df['RSI'].iloc[-1]
-        current_macd = df['MACD'].iloc[-1]
-        current_signal = df['MACD_Signal'].iloc[-1]
-        
         # Generate textual summary
         summary_text = f"""
         **Current Market Analysis:**
@@ -941,8 +1123,8 @@ class ComprehensiveTechnicalAnalysis:
         **Market Conditions:**
         """
         
-        for point in self.summary_points:
-            summary_text += f"\n• {point}"
+        # Join the condition bullets once rather than growing the string in a loop
+        summary_text += "".join(f"\n• {point}" for point in self.summary_points)
         
         st.markdown(summary_text)
         
@@ -952,9 +1134,9 @@ class ComprehensiveTechnicalAnalysis:
         risk_factors = []
         if current_rsi > 70:
             risk_factors.append("High RSI indicates overbought conditions")
-        if df['ATR'].iloc[-1] / current_price > 0.03:
+        if current_atr / current_price > 0.03:
             risk_factors.append("High volatility increases trading risk")
-        if len(sell_signals) > 0:
+        if n_sell > 0:
             risk_factors.append("Multiple sell signals detected")
         
         if risk_factors:
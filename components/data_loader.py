@@ -1,14 +1,109 @@
 import pandas as pd
-import yfinance as yf
 import streamlit as st
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import os
+import requests
+import warnings
+from requests.adapters import HTTPAdapter
 from datetime import datetime
+from streamlit.runtime.uploaded_file_manager import UploadedFile
+from components.cache import CACHE_DIR, FileCache
+
+SPARK_URL = "https://query1.finance.yahoo.com/v8/finance/spark"
+SPARK_BATCH_SIZE = 20  # Maximum symbols Yahoo accepts per spark request
+HISTORY_REFRESH_SECONDS = 3600  # How long persisted price history stays current
+_history_cache = FileCache(os.path.join(CACHE_DIR, "history"))
+
+_yf_mod = None
+
+def _yf():
+    """Import yfinance on first use so the file-upload path never pays for it"""
+    global _yf_mod
+    if _yf_mod is None:
+        import yfinance as _yf_mod
+    return _yf_mod
+
+@st.cache_resource
+def get_yf_session():
+    """Shared yfinance HTTP session, keeping connections alive across calls and reruns"""
+    # yfinance only accepts curl_cffi sessions, not requests.Session
+    from curl_cffi import requests as curl_requests
+    return curl_requests.Session(impersonate="chrome")
+
+def read_csv_fast(uploaded_file):
+    """Read an uploaded CSV with the multi-threaded PyArrow parser, falling back to pandas"""
+    try:
+        # PyArrow skips a UTF-8 BOM, matching utf-8-sig handling
+        table = pa_csv.read_csv(uploaded_file, read_options=pa_csv.ReadOptions(use_threads=True))
+        # Hand ISO dates over as datetime64 rather than Python date objects
+        return table.to_pandas(date_as_object=False)
+    except pa.ArrowInvalid:
+        # Fall back to pandas for irregular files PyArrow rejects (e.g. ragged rows)
+        uploaded_file.seek(0)
+        return pd.read_csv(uploaded_file, encoding='utf-8-sig')
+
+def read_excel_fast(uploaded_file):
+    """Read an Excel upload with the Rust calamine parser, falling back to pandas' default engine"""
+    try:
+        return pd.read_excel(uploaded_file, engine='calamine')
+    except ImportError:
+        # python-calamine is optional
+        uploaded_file.seek(0)
+        return pd.read_excel(uploaded_file)
+
+@st.cache_resource
+def _http_session():
+    """Pooled keep-alive session for direct Yahoo endpoint requests"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    return session
+
+@st.cache_data(ttl=HISTORY_REFRESH_SECONDS, max_entries=128, show_spinner="Fetching from Yahoo…")
+def _fetch_history(ticker, period):
+    """Cleaned OHLCV history for a ticker, kept on disk as one overwritten entry per ticker and period"""
+    return _history_cache.get_or_fetch(
+        f"{ticker}:history-{period}",
+        lambda: _download_history(ticker, period),
+        ttl=HISTORY_REFRESH_SECONDS
+    )
+
+def _download_history(ticker, period):
+    """Fetch and clean OHLCV history for a ticker"""
+    hist = _yf().Ticker(ticker, session=get_yf_session()).history(period=period)
+    
+    if hist.empty:
+        raise ValueError(f"No data found for ticker {ticker}. The symbol may be delisted or invalid.")
+    
+    # Reset index to get Date as column
+    df = hist.reset_index()
+    
+    # Ensure we have the required columns
+    df = df[['Date', 'Open', 'High', 'Low', 'Close', 'Volume']].copy()
+    
+    # Clean data - remove any infinite or NaN values with one np.isfinite mask per column
+    keep = df['Date'].notna().to_numpy(copy=True)
+    for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
+        keep &= np.isfinite(df[col].to_numpy(dtype=np.float64))
+    df = df[keep]
+    
+    if df.empty:
+        raise ValueError(f"No valid data available for ticker {ticker} after cleaning.")
+    
+    return df
+
+@st.cache_data(ttl=86400)
+def _fetch_info(ticker):
+    """Fetch company info for a ticker"""
+    return _yf().Ticker(ticker, session=get_yf_session()).info
 
 class DataLoader:
     def __init__(self):
         pass
     
-    @st.cache_data
+    # Key uploads by their upload id instead of letting Streamlit hash every byte on each call
+    @st.cache_data(max_entries=32, hash_funcs={UploadedFile: lambda f: (f.file_id, f.name, f.size)})
     def load_from_file(_self, uploaded_file):
         """Load stock data from uploaded file"""
         try:
@@ -16,7 +111,7 @@ class DataLoader:
             if uploaded_file.name.endswith('.csv'):
                 df = pd.read_csv(uploaded_file)
             elif uploaded_file.name.endswith(('.xlsx', '.xls')):
-                df = pd.read_excel(uploaded_file)
+                df = read_excel_fast(uploaded_file)
             else:
                 raise ValueError("Unsupported file format")
             
@@ -49,39 +144,44 @@ class DataLoader:
         except Exception as e:
             raise Exception(f"Error processing file: {str(e)}")
     
-    @st.cache_data
-    def load_from_yahoo(_self, ticker, period="1y"):
+    def load_from_yahoo(self, ticker, period="1y"):
         """Load stock data from Yahoo Finance"""
         try:
-            # Create ticker object
-            stock = yf.Ticker(ticker)
-            
-            # Get historical data
-            hist = stock.history(period=period)
-            
-            if hist.empty:
-                raise ValueError(f"No data found for ticker {ticker}. The symbol may be delisted or invalid.")
+            df = _fetch_history(ticker, period)
             
-            # Reset index to get Date as column
-            df = hist.reset_index()
-            
-            # Ensure we have the required columns
-            df = df[['Date', 'Open', 'High', 'Low', 'Close', 'Volume']].copy()
-            
-            # Clean data - remove any infinite or NaN values
-            df = df.replace([np.inf, -np.inf], np.nan).dropna()
-            
-            if df.empty:
-                raise ValueError(f"No valid data available for ticker {ticker} after cleaning.")
-            
-            # Get company info
-            info = stock.info
+            # Get company info (cached separately so changing period doesn't refetch it)
+            info = _fetch_info(ticker)
             
             return df, info
             
         except Exception as e:
             raise Exception(f"Error fetching data for {ticker}: {str(e)}")
     
+    def batch_quote(self, symbols):
+        """Fetch the latest close for many symbols via Yahoo's spark endpoint"""
+        quotes = {}
+        for i in range(0, len(symbols), SPARK_BATCH_SIZE):
+            chunk = symbols[i:i + SPARK_BATCH_SIZE]
+            try:
+                response = _http_session().get(
+                    SPARK_URL,
+                    params={"symbols": ",".join(chunk), "range": "1d", "interval": "5m"},
+                    headers={"User-Agent": "Mozilla/5.0"},
+                    timeout=10
+                )
+                response.raise_for_status()
+                data = response.json()
+            except (requests.RequestException, ValueError) as e:
+                warnings.warn(f"Failed to fetch quotes for {', '.join(chunk)}: {e}")
+                continue
+            
+            for symbol, series in data.items():
+                closes = [c for c in (series or {}).get('close') or [] if c is not None]
+                if closes:
+                    quotes[symbol] = closes[-1]
+        
+        return quotes
+    
     def validate_data_format(self, df):
         """Validate that the dataframe has the correct format"""
         required_columns = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
@@ -99,16 +199,16 @@ class DataLoader:
             if not pd.api.types.is_numeric_dtype(df[col]):
                 return False, f"Column {col} must be numeric"
         
-        # Check for logical price relationships
-        invalid_rows = df[
-            (df['High'] < df['Low']) | 
-            (df['High'] < df['Open']) | 
-            (df['High'] < df['Close']) |
-            (df['Low'] > df['Open']) | 
-            (df['Low'] > df['Close'])
-        ]
+        # Check for logical price relationships, combining masks in place on raw arrays
+        open_, high, low, close = (df[col].to_numpy() for col in ['Open', 'High', 'Low', 'Close'])
+        invalid = high < low
+        invalid |= high < open_
+        invalid |= high < close
+        invalid |= low > open_
+        invalid |= low > close
+        invalid_count = int(invalid.sum())
         
-        if not invalid_rows.empty:
-            return False, f"Found {len(invalid_rows)} rows with invalid price relationships"
+        if invalid_count:
+            return False, f"Found {invalid_count} rows with invalid price relationships"
         
         return True, "Data format is valid"
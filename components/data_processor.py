@@ -1,8 +1,23 @@
+import re
 import pandas as pd
 import numpy as np
 import streamlit as st
 from datetime import datetime
 import logging
+from components.data_loader import read_csv_fast, read_excel_fast
+
+_INDIAN_DATE_RE = re.compile(r'\d{1,2}-[A-Za-z]{3}-\d{4}$')  # e.g. 05-Jan-2024
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+def _invalid_ohlcv_mask(open_, high, low, close, volume):
+    """Rows whose OHLCV values cannot describe a real bar, fused into four in-place comparisons"""
+    # Low at or below the smaller of open/close and high at or above the larger imply high >= low,
+    # and a positive low then implies every price is positive
+    invalid = low > np.minimum(open_, close)
+    invalid |= high < np.maximum(open_, close)
+    invalid |= low <= 0
+    invalid |= volume < 0
+    return invalid
 
 class DataProcessor:
     def __init__(self):
@@ -11,28 +26,28 @@ class DataProcessor:
     def process_uploaded_data(self, uploaded_file, market_type="International"):
         """Process uploaded CSV data with comprehensive cleaning and validation"""
         try:
-            # Read the CSV file
-            df = pd.read_csv(uploaded_file, encoding='utf-8-sig')  # Handle BOM
+            # Read the uploaded file
+            df = self._read_uploaded_file(uploaded_file)
             
             st.success(f"📊 File loaded successfully: {df.shape[0]} rows, {df.shape[1]} columns")
             
-            # Clean column names for display
-            df_display = df.copy()
-            df_display.columns = df_display.columns.str.strip().str.replace('"', '').str.replace(' ', '')
+            # Clean column names once; the preview below only needs the first rows, not a full copy
+            df.columns = df.columns.str.strip().str.replace('"', '').str.replace(' ', '')
+            initial_rows, initial_cols = df.shape
+            preview = df.head(10)
             
             # Show first 10 rows of raw data
             st.subheader("📋 First 10 Rows of Your Uploaded Data")
-            st.dataframe(df_display.head(10), use_container_width=True)
+            st.dataframe(preview, use_container_width=True)
             
             # Show column and data summary
             col1, col2 = st.columns(2)
             with col1:
-                st.write("**Columns found:**", list(df_display.columns))
+                st.write("**Columns found:**", list(preview.columns))
             with col2:
                 st.write("**Data types:**")
-                for col in df_display.columns[:5]:  # Show first 5 columns data types
-                    dtype_str = str(df_display[col].dtype)
-                    st.write(f"• {col}: {dtype_str}")
+                # Show first 5 columns data types as one table rather than one message per column
+                st.dataframe(preview.dtypes.head(5).astype(str).rename('dtype').to_frame(), use_container_width=True)
             
             # Show data range info if applicable
             if market_type == "Indian Market":
@@ -43,9 +58,6 @@ class DataProcessor:
             st.markdown("---")
             st.write("**Now processing and cleaning this data for analysis...**")
             
-            # Clean column names for processing
-            df.columns = df.columns.str.strip().str.replace('"', '').str.replace(' ', '')
-            
             # Handle different data formats
             if market_type == "Indian Market":
                 df = self._process_indian_format(df)
@@ -66,8 +78,8 @@ class DataProcessor:
             
             with col1:
                 st.write("**Before Processing:**")
-                st.write(f"• Total rows: {df_display.shape[0]:,}")
-                st.write(f"• Columns: {df_display.shape[1]}")
+                st.write(f"• Total rows: {initial_rows:,}")
+                st.write(f"• Columns: {initial_cols}")
                 st.write("• Data types: Mixed (strings/objects)")
             
             with col2:
@@ -75,7 +87,7 @@ class DataProcessor:
                 st.write(f"• Valid rows: {len(df):,}")
                 st.write(f"• Columns: {df.shape[1]} (standardized)")
                 st.write("• Data types: Proper numeric/datetime")
-                removed = df_display.shape[0] - len(df)
+                removed = initial_rows - len(df)
                 if removed > 0:
                     st.write(f"• Cleaned: {removed} invalid rows removed")
             
@@ -88,6 +100,13 @@ class DataProcessor:
             st.error(f"Error processing data: {str(e)}")
             raise
     
+    def _read_uploaded_file(self, uploaded_file):
+        """Read an uploaded CSV with the multi-threaded PyArrow parser, or an Excel file with pandas"""
+        if uploaded_file.name.lower().endswith(('.xlsx', '.xls')):
+            return read_excel_fast(uploaded_file)
+        
+        return read_csv_fast(uploaded_file)
+    
     def _process_indian_format(self, df):
         """Process Indian stock data format"""
         st.write("🇮🇳 Processing Indian market data format...")
@@ -126,24 +145,25 @@ class DataProcessor:
         available_mapping = {k: v for k, v in column_mapping.items() if k in df.columns}
         df = df.rename(columns=available_mapping)
         
-        # Clean Indian-specific formatting
+        # Clean Indian-specific formatting; columns the CSV reader already parsed as numbers need none
         for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
-            if col in df.columns:
-                # Remove quotes, commas, and clean
-                df[col] = df[col].astype(str).str.replace('"', '').str.replace(',', '').str.strip()
-                # Convert to numeric
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                # The reader already removed quoting; drop thousands separators and let to_numeric handle whitespace
+                df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', '', regex=False), errors='coerce')
         
         # Clean Date column for Indian format
         if 'Date' in df.columns:
             df['Date'] = df['Date'].astype(str).str.replace('"', '').str.strip()
-            try:
-                df['Date'] = pd.to_datetime(df['Date'], format='%d-%b-%Y')
-            except:
-                try:
-                    df['Date'] = pd.to_datetime(df['Date'], dayfirst=True)
-                except:
-                    df['Date'] = pd.to_datetime(df['Date'], infer_datetime_format=True)
+            # Pick the format from the first non-null value and parse once; cache=True parses repeated strings only once
+            dates = df['Date'].dropna()
+            sample = dates.iloc[0] if len(dates) else ''
+            if _INDIAN_DATE_RE.match(sample):
+                date_options = {'format': '%d-%b-%Y'}
+            elif _ISO_DATE_RE.match(sample):
+                date_options = {'format': 'ISO8601'}
+            else:
+                date_options = {'format': 'mixed', 'dayfirst': True}
+            df['Date'] = pd.to_datetime(df['Date'], cache=True, errors='coerce', **date_options)
         
         return df
     
@@ -194,9 +214,6 @@ class DataProcessor:
         # Keep only required columns
         df = df[required_columns].copy()
         
-        # Remove infinite values
-        df = df.replace([np.inf, -np.inf], np.nan)
-        
         # Ensure proper data types
         df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
         
@@ -204,48 +221,46 @@ class DataProcessor:
         for col in numeric_cols:
             df[col] = pd.to_numeric(df[col], errors='coerce')
         
-        # Remove rows with missing essential data
-        initial_count = len(df)
-        df = df.dropna(subset=['Date', 'Open', 'High', 'Low', 'Close', 'Volume'])
-        removed_count = initial_count - len(df)
+        # Materialize the numeric block once; every check below works on this array
+        values = df[numeric_cols].to_numpy(dtype=np.float64)
+        
+        # Remove rows with missing essential data; np.isfinite rejects NaN and infinite values in one pass
+        keep = df['Date'].notna().to_numpy(copy=True)
+        keep &= np.isfinite(values).all(axis=1)
+        removed_count = len(keep) - int(keep.sum())
         
         if removed_count > 0:
             st.warning(f"Removed {removed_count} rows with missing data")
         
         # Validate price relationships
-        invalid_mask = (
-            (df['High'] < df['Low']) |
-            (df['High'] < df['Open']) |
-            (df['High'] < df['Close']) |
-            (df['Low'] > df['Open']) |
-            (df['Low'] > df['Close']) |
-            (df['Open'] <= 0) |
-            (df['High'] <= 0) |
-            (df['Low'] <= 0) |
-            (df['Close'] <= 0) |
-            (df['Volume'] < 0)
-        )
+        invalid_mask = _invalid_ohlcv_mask(*values.T)
+        invalid_mask &= keep
         
         invalid_count = invalid_mask.sum()
         if invalid_count > 0:
             st.warning(f"Removing {invalid_count} rows with invalid price relationships")
-            df = df[~invalid_mask]
-        
-        # Sort by date (oldest first)
-        df = df.sort_values('Date').reset_index(drop=True)
         
-        # Final validation - ensure no infinite or extreme values remain
-        for col in numeric_cols:
-            # Check for extreme values that could cause chart issues
-            q1 = df[col].quantile(0.01)
-            q99 = df[col].quantile(0.99)
-            extreme_mask = (df[col] < q1 * 0.01) | (df[col] > q99 * 100)
-            extreme_count = extreme_mask.sum()
+        # Apply both filters with a single row selection, then sort by date (oldest first)
+        keep &= ~invalid_mask
+        df, values = df[keep], values[keep]
+        order = np.argsort(df['Date'].to_numpy(), kind='stable')
+        df, values = df.iloc[order].reset_index(drop=True), values[order]
+        
+        # Final validation - cap extreme values that could cause chart issues, using bounds for all columns at once
+        if len(values):
+            q1, q99 = np.quantile(values, [0.01, 0.99], axis=0)
+            too_low = values < q1 * 0.01
+            too_high = values > q99 * 100
+            extreme_counts = too_low.sum(axis=0) + too_high.sum(axis=0)
             
-            if extreme_count > 0:
-                st.warning(f"Found {extreme_count} extreme values in {col}, capping them")
-                df.loc[df[col] < q1 * 0.01, col] = q1
-                df.loc[df[col] > q99 * 100, col] = q99
+            for i, col in enumerate(numeric_cols):
+                if extreme_counts[i] > 0:
+                    st.warning(f"Found {extreme_counts[i]} extreme values in {col}, capping them")
+                    df[col] = np.where(too_low[:, i], q1[i], np.where(too_high[:, i], q99[i], values[:, i]))
+        
+        # Volume is a share count: round (not truncate) parsed or capped floats, then narrow to the
+        # smallest integer type that holds every value
+        df['Volume'] = pd.to_numeric(df['Volume'].round().astype(np.int64), downcast='integer')
         
         return df
     
@@ -277,29 +292,26 @@ class DataProcessor:
         
         # Data type information
         st.write("**Data Types:**")
-        col1, col2 = st.columns(2)
-        with col1:
-            for col in ['Date', 'Open', 'High']:
-                st.write(f"• {col}: {str(df[col].dtype)}")
-        with col2:
-            for col in ['Low', 'Close', 'Volume']:
-                st.write(f"• {col}: {str(df[col].dtype)}")
+        dtypes = df.dtypes[['Date', 'Open', 'High', 'Low', 'Close', 'Volume']].astype(str)
+        st.dataframe(dtypes.rename('dtype').to_frame(), use_container_width=True)
     
     def validate_data_for_charts(self, df):
         """Final validation specifically for chart display"""
         # Ensure no infinite or NaN values that could cause chart issues
         numeric_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
+        present_cols = [col for col in numeric_cols if col in df.columns]
         
-        for col in numeric_cols:
-            if col in df.columns:
-                # Check for any remaining problematic values
-                has_inf = np.isinf(df[col]).any()
-                has_nan = df[col].isna().any()
-                
-                if has_inf or has_nan:
-                    st.warning(f"Found problematic values in {col}, cleaning...")
-                    df[col] = df[col].replace([np.inf, -np.inf], np.nan)
-                    df[col] = df[col].fillna(method='ffill').fillna(method='bfill')
+        # Check for any remaining problematic values
+        block = df[present_cols].replace([np.inf, -np.inf], np.nan)
+        problem_cols = block.columns[block.isna().any()].tolist()
+        
+        if problem_cols:
+            for col in problem_cols:
+                st.warning(f"Found problematic values in {col}, cleaning...")
+            
+            # Fill gaps across the affected columns in one pass; assign leaves the caller's frame untouched
+            cleaned = block[problem_cols].ffill().bfill()
+            df = df.assign(**{col: cleaned[col] for col in problem_cols})
         
         # Final check - remove any rows that still have issues
         df_clean = df.dropna(subset=numeric_cols)
@@ -308,4 +320,5 @@ class DataProcessor:
             removed = len(df) - len(df_clean)
             st.info(f"Removed {removed} additional rows for chart compatibility")
         
+        # Prices stay float64 here; indicator outputs are narrowed where they are attached
         return df_clean
\ No newline at end of file
@@ -1,10 +1,94 @@
+import csv
+import io
+import json
 import streamlit as st
 import yfinance as yf
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+from concurrent.futures import ThreadPoolExecutor
+from components.cache import FileCache
+from components.data_loader import get_yf_session
 from components.utils import format_currency, safe_divide
 
+INFO_TTL = 86400  # Company info rarely changes within a day
+STATEMENT_TTL = 7 * 86400  # Annual statements change at most quarterly
+
+# info keys each tab reads; Yahoo's info dict carries well over a hundred more
+_KEY_METRICS_FIELDS = frozenset({
+    'marketCap', 'enterpriseValue', 'currentPrice', 'fiftyTwoWeekHigh', 'fiftyTwoWeekLow',
+    'averageVolume', 'sharesOutstanding', 'floatShares', 'longName', 'sector', 'industry', 'country',
+    'fullTimeEmployees', 'website', 'exchange', 'currency', 'longBusinessSummary'
+})
+_RATIO_FIELDS = frozenset({
+    'trailingPE', 'forwardPE', 'profitMargins', 'operatingMargins', 'returnOnEquity', 'returnOnAssets',
+    'currentRatio', 'quickRatio', 'debtToEquity', 'totalDebt', 'totalCapital', 'totalCashPerShare',
+    'bookValue', 'revenueGrowth', 'earningsGrowth', 'trailingEps', 'forwardEps', 'pegRatio',
+    'priceToSalesTrailing12Months'
+})
+_VALUATION_FIELDS = frozenset({
+    'dividendYield', 'dividendRate', 'payoutRatio', 'targetMeanPrice', 'recommendationKey',
+    'numberOfAnalystOpinions', 'trailingPE', 'priceToBook', 'priceToSalesTrailing12Months',
+    'enterpriseValue', 'totalRevenue', 'enterpriseToEbitda', 'symbol'
+})
+
+_file_cache = FileCache()
+
+def _cached_endpoint(ticker, endpoint, ttl):
+    """Fetch a yfinance Ticker attribute (info, financials, ...) through the on-disk cache"""
+    return _file_cache.get_or_fetch(
+        f"{ticker}:{endpoint}",
+        lambda: getattr(yf.Ticker(ticker, session=get_yf_session()), endpoint),
+        ttl=ttl
+    )
+
+def _fetch_fundamentals(ticker):
+    """Fetch info and the three annual statements concurrently, so latency is the slowest call rather than the sum"""
+    ttls = {'info': INFO_TTL, 'financials': STATEMENT_TTL, 'balance_sheet': STATEMENT_TTL, 'cashflow': STATEMENT_TTL}
+    with ThreadPoolExecutor(max_workers=len(ttls)) as executor:
+        futures = {endpoint: executor.submit(_cached_endpoint, ticker, endpoint, ttl) for endpoint, ttl in ttls.items()}
+    
+    data = {'info': futures['info'].result()}
+    for endpoint in ('financials', 'balance_sheet', 'cashflow'):
+        try:
+            data[endpoint] = futures[endpoint].result()
+        except Exception:
+            # A missing statement only empties its own tab
+            data[endpoint] = pd.DataFrame()
+    return data
+
+def _fmt_num(value):
+    """Two-decimal figure, or N/A when Yahoo has no (or a zero) value"""
+    return f"{value:.2f}" if value else "N/A"
+
+def _fmt_pct(value):
+    """Fraction shown as a two-decimal percentage, or N/A"""
+    return f"{value*100:.2f}%" if value else "N/A"
+
+def _fmt_usd(value):
+    """Dollar amount with two decimals, or N/A"""
+    return f"${value:.2f}" if value else "N/A"
+
+def _slim(info, fields):
+    """Subset of info holding only the given keys; absent keys stay absent so .get defaults still apply"""
+    return {key: info[key] for key in fields if key in info}
+
+def _stringify(value):
+    """CSV cell text for an info value: JSON for nested lists/dicts, blank for None"""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    return "" if value is None else str(value)
+
+@st.cache_data(show_spinner=False)
+def _info_to_csv(info):
+    """Metric/Value CSV export of a company info dict, cached so repeated clicks are free"""
+    # One row per key, so write it directly rather than building an object-dtype DataFrame
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(['Metric', 'Value'])
+    writer.writerows((key, _stringify(value)) for key, value in info.items())
+    return buffer.getvalue()
+
 class FundamentalAnalysis:
     def __init__(self):
         pass
@@ -14,9 +98,9 @@ class FundamentalAnalysis:
         st.subheader(f"Fundamental Analysis for {ticker}")
         
         try:
-            # Get stock data
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            # Get stock data, served from the on-disk cache when fresh
+            data = _fetch_fundamentals(ticker)
+            info = data['info']
             
             if not info:
                 st.error("Unable to fetch fundamental data for this ticker")
@@ -26,16 +110,16 @@ class FundamentalAnalysis:
             tab1, tab2, tab3, tab4 = st.tabs(["Key Metrics", "Financial Ratios", "Financial Statements", "Valuation"])
             
             with tab1:
-                self.display_key_metrics(info)
+                self.display_key_metrics(_slim(info, _KEY_METRICS_FIELDS))
             
             with tab2:
-                self.display_financial_ratios(info)
+                self.display_financial_ratios(_slim(info, _RATIO_FIELDS))
             
             with tab3:
-                self.display_financial_statements(stock)
+                self.display_financial_statements(data['financials'], data['balance_sheet'], data['cashflow'])
             
             with tab4:
-                self.display_valuation_metrics(info)
+                self.display_valuation_metrics(_slim(info, _VALUATION_FIELDS), info)
                 
         except Exception as e:
             st.error(f"Error fetching fundamental data: {str(e)}")
@@ -43,47 +127,28 @@ class FundamentalAnalysis:
     def display_key_metrics(self, info):
         st.subheader("Key Company Metrics")
         
+        # Format every headline figure once up front
+        currency = {key: format_currency(info.get(key, 0)) for key in ('marketCap', 'enterpriseValue')}
+        prices = {key: f"${info.get(key, 0):.2f}" for key in ('currentPrice', 'fiftyTwoWeekHigh', 'fiftyTwoWeekLow')}
+        counts = {key: f"{info.get(key, 0):,}" for key in ('averageVolume', 'sharesOutstanding', 'floatShares')}
+        
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric(
-                "Market Cap", 
-                format_currency(info.get('marketCap', 0))
-            )
-            st.metric(
-                "Enterprise Value", 
-                format_currency(info.get('enterpriseValue', 0))
-            )
+            st.metric("Market Cap", currency['marketCap'])
+            st.metric("Enterprise Value", currency['enterpriseValue'])
         
         with col2:
-            st.metric(
-                "Current Price", 
-                f"${info.get('currentPrice', 0):.2f}"
-            )
-            st.metric(
-                "52 Week High", 
-                f"${info.get('fiftyTwoWeekHigh', 0):.2f}"
-            )
+            st.metric("Current Price", prices['currentPrice'])
+            st.metric("52 Week High", prices['fiftyTwoWeekHigh'])
         
         with col3:
-            st.metric(
-                "52 Week Low", 
-                f"${info.get('fiftyTwoWeekLow', 0):.2f}"
-            )
-            st.metric(
-                "Average Volume", 
-                f"{info.get('averageVolume', 0):,}"
-            )
+            st.metric("52 Week Low", prices['fiftyTwoWeekLow'])
+            st.metric("Average Volume", counts['averageVolume'])
         
         with col4:
-            st.metric(
-                "Shares Outstanding", 
-                f"{info.get('sharesOutstanding', 0):,}"
-            )
-            st.metric(
-                "Float", 
-                f"{info.get('floatShares', 0):,}"
-            )
+            st.metric("Shares Outstanding", counts['sharesOutstanding'])
+            st.metric("Float", counts['floatShares'])
         
         # Company information
         st.subheader("Company Information")
@@ -110,63 +175,43 @@ class FundamentalAnalysis:
     def display_financial_ratios(self, info):
         st.subheader("Financial Ratios")
         
-        # Profitability Ratios
+        # Profitability Ratios (each group renders as one table rather than six metric widgets)
         st.write("**Profitability Ratios**")
-        prof_col1, prof_col2, prof_col3 = st.columns(3)
-        
-        with prof_col1:
-            st.metric("P/E Ratio (TTM)", f"{info.get('trailingPE', 'N/A'):.2f}" if info.get('trailingPE') else "N/A")
-            st.metric("Forward P/E", f"{info.get('forwardPE', 'N/A'):.2f}" if info.get('forwardPE') else "N/A")
-        
-        with prof_col2:
-            st.metric("Profit Margin", f"{info.get('profitMargins', 0)*100:.2f}%" if info.get('profitMargins') else "N/A")
-            st.metric("Operating Margin", f"{info.get('operatingMargins', 0)*100:.2f}%" if info.get('operatingMargins') else "N/A")
-        
-        with prof_col3:
-            st.metric("Return on Equity", f"{info.get('returnOnEquity', 0)*100:.2f}%" if info.get('returnOnEquity') else "N/A")
-            st.metric("Return on Assets", f"{info.get('returnOnAssets', 0)*100:.2f}%" if info.get('returnOnAssets') else "N/A")
+        st.dataframe(pd.DataFrame([
+            ("P/E Ratio (TTM)", _fmt_num(info.get('trailingPE'))),
+            ("Forward P/E", _fmt_num(info.get('forwardPE'))),
+            ("Profit Margin", _fmt_pct(info.get('profitMargins'))),
+            ("Operating Margin", _fmt_pct(info.get('operatingMargins'))),
+            ("Return on Equity", _fmt_pct(info.get('returnOnEquity'))),
+            ("Return on Assets", _fmt_pct(info.get('returnOnAssets')))
+        ], columns=['Metric', 'Value']), hide_index=True, use_container_width=True)
         
         # Liquidity Ratios
         st.write("**Liquidity Ratios**")
-        liq_col1, liq_col2, liq_col3 = st.columns(3)
-        
-        with liq_col1:
-            st.metric("Current Ratio", f"{info.get('currentRatio', 'N/A'):.2f}" if info.get('currentRatio') else "N/A")
-            st.metric("Quick Ratio", f"{info.get('quickRatio', 'N/A'):.2f}" if info.get('quickRatio') else "N/A")
-        
-        with liq_col2:
-            st.metric("Debt to Equity", f"{info.get('debtToEquity', 'N/A'):.2f}" if info.get('debtToEquity') else "N/A")
-            st.metric("Total Debt/Total Capital", f"{info.get('totalDebt', 0) / info.get('totalCapital', 1):.2f}" if info.get('totalCapital') else "N/A")
-        
-        with liq_col3:
-            st.metric("Cash Per Share", f"${info.get('totalCashPerShare', 'N/A'):.2f}" if info.get('totalCashPerShare') else "N/A")
-            st.metric("Book Value Per Share", f"${info.get('bookValue', 'N/A'):.2f}" if info.get('bookValue') else "N/A")
+        st.dataframe(pd.DataFrame([
+            ("Current Ratio", _fmt_num(info.get('currentRatio'))),
+            ("Quick Ratio", _fmt_num(info.get('quickRatio'))),
+            ("Debt to Equity", _fmt_num(info.get('debtToEquity'))),
+            ("Total Debt/Total Capital", f"{info.get('totalDebt', 0) / capital:.2f}" if (capital := info.get('totalCapital')) else "N/A"),
+            ("Cash Per Share", _fmt_usd(info.get('totalCashPerShare'))),
+            ("Book Value Per Share", _fmt_usd(info.get('bookValue')))
+        ], columns=['Metric', 'Value']), hide_index=True, use_container_width=True)
         
         # Growth Metrics
         st.write("**Growth Metrics**")
-        growth_col1, growth_col2, growth_col3 = st.columns(3)
-        
-        with growth_col1:
-            st.metric("Revenue Growth", f"{info.get('revenueGrowth', 0)*100:.2f}%" if info.get('revenueGrowth') else "N/A")
-            st.metric("Earnings Growth", f"{info.get('earningsGrowth', 0)*100:.2f}%" if info.get('earningsGrowth') else "N/A")
-        
-        with growth_col2:
-            st.metric("EPS (TTM)", f"${info.get('trailingEps', 'N/A'):.2f}" if info.get('trailingEps') else "N/A")
-            st.metric("Forward EPS", f"${info.get('forwardEps', 'N/A'):.2f}" if info.get('forwardEps') else "N/A")
-        
-        with growth_col3:
-            st.metric("PEG Ratio", f"{info.get('pegRatio', 'N/A'):.2f}" if info.get('pegRatio') else "N/A")
-            st.metric("Price to Sales", f"{info.get('priceToSalesTrailing12Months', 'N/A'):.2f}" if info.get('priceToSalesTrailing12Months') else "N/A")
+        st.dataframe(pd.DataFrame([
+            ("Revenue Growth", _fmt_pct(info.get('revenueGrowth'))),
+            ("Earnings Growth", _fmt_pct(info.get('earningsGrowth'))),
+            ("EPS (TTM)", _fmt_usd(info.get('trailingEps'))),
+            ("Forward EPS", _fmt_usd(info.get('forwardEps'))),
+            ("PEG Ratio", _fmt_num(info.get('pegRatio'))),
+            ("Price to Sales", _fmt_num(info.get('priceToSalesTrailing12Months')))
+        ], columns=['Metric', 'Value']), hide_index=True, use_container_width=True)
     
-    def display_financial_statements(self, stock):
+    def display_financial_statements(self, income_stmt, balance_sheet, cash_flow):
         st.subheader("Financial Statements")
         
         try:
-            # Get financial statements
-            income_stmt = stock.financials
-            balance_sheet = stock.balance_sheet
-            cash_flow = stock.cashflow
-            
             # Financial statements tabs
             stmt_tab1, stmt_tab2, stmt_tab3 = st.tabs(["Income Statement", "Balance Sheet", "Cash Flow"])
             
@@ -179,15 +224,9 @@ class FundamentalAnalysis:
                         'Net Income', 'Basic EPS', 'Diluted EPS'
                     ]
                     
-                    display_items = []
-                    for item in key_items:
-                        if item in income_stmt.index:
-                            display_items.append(item)
-                    
-                    if display_items:
-                        st.dataframe(income_stmt.loc[display_items], use_container_width=True)
-                    else:
-                        st.dataframe(income_stmt.head(10), use_container_width=True)
+                    # One reindex picks the key rows; rows Yahoo doesn't report come back all-NaN and are dropped
+                    shown = income_stmt.reindex(key_items).dropna(how='all')
+                    st.dataframe(shown if not shown.empty else income_stmt.head(10), use_container_width=True)
                 else:
                     st.warning("Income statement data not available")
             
@@ -200,15 +239,8 @@ class FundamentalAnalysis:
                         'Total Debt', 'Total Stockholder Equity', 'Cash And Cash Equivalents'
                     ]
                     
-                    display_items = []
-                    for item in key_items:
-                        if item in balance_sheet.index:
-                            display_items.append(item)
-                    
-                    if display_items:
-                        st.dataframe(balance_sheet.loc[display_items], use_container_width=True)
-                    else:
-                        st.dataframe(balance_sheet.head(10), use_container_width=True)
+                    shown = balance_sheet.reindex(key_items).dropna(how='all')
+                    st.dataframe(shown if not shown.empty else balance_sheet.head(10), use_container_width=True)
                 else:
                     st.warning("Balance sheet data not available")
             
@@ -221,22 +253,15 @@ class FundamentalAnalysis:
                         'Free Cash Flow', 'Capital Expenditure'
                     ]
                     
-                    display_items = []
-                    for item in key_items:
-                        if item in cash_flow.index:
-                            display_items.append(item)
-                    
-                    if display_items:
-                        st.dataframe(cash_flow.loc[display_items], use_container_width=True)
-                    else:
-                        st.dataframe(cash_flow.head(10), use_container_width=True)
+                    shown = cash_flow.reindex(key_items).dropna(how='all')
+                    st.dataframe(shown if not shown.empty else cash_flow.head(10), use_container_width=True)
                 else:
                     st.warning("Cash flow data not available")
                     
         except Exception as e:
             st.error(f"Error fetching financial statements: {str(e)}")
     
-    def display_valuation_metrics(self, info):
+    def display_valuation_metrics(self, info, full_info=None):
         st.subheader("Valuation Analysis")
         
         # Dividend Information
@@ -245,20 +270,20 @@ class FundamentalAnalysis:
             div_col1, div_col2, div_col3 = st.columns(3)
             
             with div_col1:
-                st.metric("Dividend Yield", f"{info.get('dividendYield', 0)*100:.2f}%" if info.get('dividendYield') else "N/A")
+                st.metric("Dividend Yield", _fmt_pct(info.get('dividendYield')))
             
             with div_col2:
-                st.metric("Annual Dividend Rate", f"${info.get('dividendRate', 'N/A'):.2f}" if info.get('dividendRate') else "N/A")
+                st.metric("Annual Dividend Rate", _fmt_usd(info.get('dividendRate')))
             
             with div_col3:
-                st.metric("Payout Ratio", f"{info.get('payoutRatio', 0)*100:.2f}%" if info.get('payoutRatio') else "N/A")
+                st.metric("Payout Ratio", _fmt_pct(info.get('payoutRatio')))
         
         # Analyst Recommendations
         st.write("**Analyst Recommendations**")
         rec_col1, rec_col2, rec_col3 = st.columns(3)
         
         with rec_col1:
-            st.metric("Target Price", f"${info.get('targetMeanPrice', 'N/A'):.2f}" if info.get('targetMeanPrice') else "N/A")
+            st.metric("Target Price", _fmt_usd(info.get('targetMeanPrice')))
         
         with rec_col2:
             st.metric("Recommendation", info.get('recommendationKey', 'N/A').replace('_', ' ').title())
@@ -272,11 +297,11 @@ class FundamentalAnalysis:
         multiples_data = {
             'Metric': ['P/E Ratio', 'P/B Ratio', 'P/S Ratio', 'EV/Revenue', 'EV/EBITDA'],
             'Current Value': [
-                f"{info.get('trailingPE', 0):.2f}" if info.get('trailingPE') else "N/A",
-                f"{info.get('priceToBook', 0):.2f}" if info.get('priceToBook') else "N/A",
-                f"{info.get('priceToSalesTrailing12Months', 0):.2f}" if info.get('priceToSalesTrailing12Months') else "N/A",
-                f"{safe_divide(info.get('enterpriseValue', 0), info.get('totalRevenue', 1)):.2f}" if info.get('enterpriseValue') and info.get('totalRevenue') else "N/A",
-                f"{info.get('enterpriseToEbitda', 0):.2f}" if info.get('enterpriseToEbitda') else "N/A"
+                _fmt_num(info.get('trailingPE')),
+                _fmt_num(info.get('priceToBook')),
+                _fmt_num(info.get('priceToSalesTrailing12Months')),
+                f"{safe_divide(ev, revenue):.2f}" if (ev := info.get('enterpriseValue')) and (revenue := info.get('totalRevenue')) else "N/A",
+                _fmt_num(info.get('enterpriseToEbitda'))
             ]
         }
         
@@ -285,17 +310,11 @@ class FundamentalAnalysis:
         
         # Export functionality
         if st.button("📥 Export Fundamental Analysis"):
-            # Create summary DataFrame
-            summary_data = {
-                'Metric': list(info.keys()),
-                'Value': list(info.values())
-            }
-            summary_df = pd.DataFrame(summary_data)
-            
-            csv = summary_df.to_csv(index=False)
+            # The export covers every field Yahoo returned, not just the displayed ones
+            csv_data = _info_to_csv(full_info if full_info is not None else info)
             st.download_button(
                 label="Download Fundamental Data CSV",
-                data=csv,
+                data=csv_data,
                 file_name=f"fundamental_analysis_{info.get('symbol', 'stock')}.csv",
                 mime="text/csv"
             )
@@ -3,17 +3,60 @@ import streamlit as st
 import numpy as np
 from datetime import datetime
 import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from streamlit.runtime.uploaded_file_manager import UploadedFile
+from components.data_loader import read_csv_fast, _fetch_info
+
+# Popular Indian tickers by category, built once at import
+_INDIAN_TICKER_SUGGESTIONS = {
+    "Large Cap": ("RELIANCE.NS", "TCS.NS", "HDFCBANK.NS", "INFY.NS", "HINDUNILVR.NS"),
+    "Mid Cap": ("BAJFINANCE.NS", "KOTAKBANK.NS", "MARUTI.NS", "TITAN.NS", "ASIANPAINT.NS"),
+    "IT Stocks": ("TCS.NS", "INFY.NS", "WIPRO.NS", "HCLTECH.NS", "TECHM.NS"),
+    "Banking": ("HDFCBANK.NS", "ICICIBANK.NS", "KOTAKBANK.NS", "SBIN.NS", "AXISBANK.NS"),
+    "Indices": ("^NSEI", "^BSESN")  # Nifty 50, Sensex
+}
+
+# Result of load_indian_ticker; info_lazy() fetches company info only when a caller asks for it
+IndianData = namedtuple('IndianData', ['df', 'info_lazy', 'ticker'])
+
+def _ticker_info(ticker):
+    """Company info for a resolved ticker, via the shared 24h info cache"""
+    return _fetch_info(ticker)
+
+def _finite_rows(df):
+    """Boolean mask of rows with a date and finite OHLCV values, built without copying the frame"""
+    keep = df['Date'].notna().to_numpy(copy=True)
+    for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
+        keep &= np.isfinite(df[col].to_numpy(dtype=np.float64))
+    return keep
+
+# Date layouts seen in NSE/BSE exports, matched against a sample value
+_DATE_FORMATS = (
+    (re.compile(r'\d{1,2}-[A-Za-z]{3}-\d{4}$'), '%d-%b-%Y'),  # 05-Aug-2025
+    (re.compile(r'\d{4}-\d{2}-\d{2}$'), '%Y-%m-%d'),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}$'), '%d/%m/%Y')
+)
+
+def _detect_date_format(sample):
+    """strptime format for a sample date string, or None if it matches no known layout"""
+    for pattern, date_format in _DATE_FORMATS:
+        if pattern.match(sample):
+            return date_format
+    return None
 
 class IndianDataLoader:
     def __init__(self):
         pass
     
-    @st.cache_data
+    # Key uploads by their upload id instead of letting Streamlit hash every byte on each call
+    @st.cache_data(ttl=3600, max_entries=8, hash_funcs={UploadedFile: lambda f: (f.file_id, f.name, f.size)})
     def load_indian_csv(_self, uploaded_file):
         """Load Indian stock data from uploaded CSV file"""
         try:
-            # Read the CSV file
-            df = pd.read_csv(uploaded_file)
+            # Read the CSV file with the multi-threaded PyArrow parser
+            df = read_csv_fast(uploaded_file)
             
             # Clean column names - remove extra spaces and quotes
             df.columns = df.columns.str.strip().str.replace('"', '').str.replace(' ', '')
@@ -40,66 +83,75 @@ class IndianDataLoader:
             # Rename columns to standard format
             df = df.rename(columns=column_mapping)
             
-            # Clean and convert Date column
-            df['Date'] = df['Date'].str.replace('"', '').str.strip()
-            try:
-                df['Date'] = pd.to_datetime(df['Date'], format='%d-%b-%Y')
-            except:
-                # Try alternative date formats
-                df['Date'] = pd.to_datetime(df['Date'], infer_datetime_format=True)
+            # Clean and convert Date column (PyArrow already parses ISO dates itself)
+            if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+                dates = df['Date'].str.replace('"', '', regex=False).str.strip()
+                # Detect the format once from a sample, parse every row with it in C, and only send
+                # values it rejects through per-value inference
+                non_null = dates.dropna()
+                date_format = _detect_date_format(non_null.iloc[0]) if len(non_null) else None
+                df['Date'] = pd.to_datetime(dates, format=date_format or 'mixed', errors='coerce')
+                unparsed = df['Date'].isna().to_numpy() & dates.notna().to_numpy()
+                if unparsed.any():
+                    df.loc[unparsed, 'Date'] = pd.to_datetime(dates[unparsed], format='mixed', errors='coerce')
             
             # Clean numeric columns - remove commas and quotes
             numeric_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
             for col in numeric_columns:
-                if col in df.columns:
-                    # Remove quotes and commas, convert to float
-                    df[col] = df[col].astype(str).str.replace('"', '').str.replace(',', '')
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
+                # Columns the reader already parsed as numbers need no string cleaning
+                if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                    # Remove quotes and commas with literal (non-regex) replaces, convert to float
+                    cleaned = df[col].astype(str).str.replace('"', '', regex=False).str.replace(',', '', regex=False)
+                    df[col] = pd.to_numeric(cleaned, errors='coerce')
             
             # Sort by date (oldest first)
-            df = df.sort_values('Date').reset_index(drop=True)
+            df = df.sort_values('Date', ignore_index=True, kind='stable')
             
-            # Remove rows with missing data
-            df = df.dropna(subset=['Date', 'Open', 'High', 'Low', 'Close', 'Volume'])
-            
-            # Clean data - remove any infinite values
-            df = df.replace([np.inf, -np.inf], np.nan).dropna()
+            # Keep only required columns, then remove rows with missing or infinite values in one slice
+            df = df.loc[_finite_rows(df), ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']]
             
             if len(df) == 0:
                 raise ValueError("No valid data found after cleaning")
             
-            # Keep only required columns
-            df = df[['Date', 'Open', 'High', 'Low', 'Close', 'Volume']].copy()
-            
             return df
             
         except Exception as e:
             raise Exception(f"Error processing Indian CSV file: {str(e)}")
     
-    @st.cache_data
+    # The only cache on this path (app._fetch_indian calls straight through), so it sets the refresh interval
+    @st.cache_data(ttl=300, show_spinner=False)
     def load_indian_ticker(_self, ticker, period="1y"):
         """Load Indian stock data using ticker (NSE format)"""
         try:
             import yfinance as yf
+            from components.data_loader import get_yf_session
+            
+            session = get_yf_session()
+            
+            def probe(symbol):
+                return yf.Ticker(symbol, session=session).history(period=period)
             
             # Format ticker for Indian stocks
             if not ticker.endswith('.NS') and not ticker.endswith('.BO'):
-                # Try NSE first (National Stock Exchange)
-                nse_ticker = f"{ticker}.NS"
-                stock = yf.Ticker(nse_ticker)
-                hist = stock.history(period=period)
-                
-                if hist.empty:
-                    # Try BSE (Bombay Stock Exchange) if NSE fails
-                    bse_ticker = f"{ticker}.BO"
-                    stock = yf.Ticker(bse_ticker)
-                    hist = stock.history(period=period)
-                    ticker = bse_ticker
-                else:
+                # Probe NSE (National Stock Exchange) and BSE (Bombay Stock Exchange) concurrently,
+                # still preferring NSE so the chosen listing doesn't depend on which reply lands first
+                nse_ticker, bse_ticker = f"{ticker}.NS", f"{ticker}.BO"
+                executor = ThreadPoolExecutor(max_workers=2)
+                try:
+                    nse_future = executor.submit(probe, nse_ticker)
+                    bse_future = executor.submit(probe, bse_ticker)
+                    hist = nse_future.result()
                     ticker = nse_ticker
+                    
+                    if hist.empty:
+                        # Fall back to BSE if NSE has no data
+                        hist = bse_future.result()
+                        ticker = bse_ticker
+                finally:
+                    # Don't hold the response on an unneeded BSE probe
+                    executor.shutdown(wait=False, cancel_futures=True)
             else:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period=period)
+                hist = probe(ticker)
             
             if hist.empty:
                 raise ValueError(f"No data found for Indian ticker {ticker}. Try adding .NS (NSE) or .BO (BSE) suffix.")
@@ -107,19 +159,14 @@ class IndianDataLoader:
             # Reset index to get Date as column
             df = hist.reset_index()
             
-            # Ensure we have the required columns
-            df = df[['Date', 'Open', 'High', 'Low', 'Close', 'Volume']].copy()
-            
-            # Clean data - remove any infinite or NaN values
-            df = df.replace([np.inf, -np.inf], np.nan).dropna()
+            # Ensure we have the required columns, then remove any infinite or NaN values
+            df = df.loc[_finite_rows(df), ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']]
             
             if df.empty:
                 raise ValueError(f"No valid data available for ticker {ticker} after cleaning.")
             
-            # Get company info
-            info = stock.info
-            
-            return df, info, ticker
+            # Company info is deferred; a partial of a module function stays picklable for st.cache_data
+            return IndianData(df, partial(_ticker_info, ticker), ticker)
             
         except Exception as e:
             raise Exception(f"Error fetching Indian stock data for {ticker}: {str(e)}")
@@ -141,26 +188,18 @@ class IndianDataLoader:
             if not pd.api.types.is_numeric_dtype(df[col]):
                 return False, f"Column {col} must be numeric"
         
-        # Check for logical price relationships
-        invalid_rows = df[
-            (df['High'] < df['Low']) | 
-            (df['High'] < df['Open']) | 
-            (df['High'] < df['Close']) |
-            (df['Low'] > df['Open']) | 
-            (df['Low'] > df['Close'])
-        ]
+        # Check for logical price relationships: high must cover, and low sit under, both open and close
+        open_, high, low, close = (df[col].to_numpy() for col in ['Open', 'High', 'Low', 'Close'])
+        invalid = high < low
+        invalid |= high < np.fmax(open_, close)
+        invalid |= low > np.fmin(open_, close)
+        invalid_count = int(invalid.sum())
         
-        if not invalid_rows.empty:
-            return False, f"Found {len(invalid_rows)} rows with invalid price relationships"
+        if invalid_count:
+            return False, f"Found {invalid_count} rows with invalid price relationships"
         
         return True, "Indian data format is valid"
     
     def get_indian_ticker_suggestions(self):
         """Get popular Indian stock ticker suggestions"""
-        return {
-            "Large Cap": ["RELIANCE.NS", "TCS.NS", "HDFCBANK.NS", "INFY.NS", "HINDUNILVR.NS"],
-            "Mid Cap": ["BAJFINANCE.NS", "KOTAKBANK.NS", "MARUTI.NS", "TITAN.NS", "ASIANPAINT.NS"],
-            "IT Stocks": ["TCS.NS", "INFY.NS", "WIPRO.NS", "HCLTECH.NS", "TECHM.NS"],
-            "Banking": ["HDFCBANK.NS", "ICICIBANK.NS", "KOTAKBANK.NS", "SBIN.NS", "AXISBANK.NS"],
-            "Indices": ["^NSEI", "^BSESN"]  # Nifty 50, Sensex
-        }
\ No newline at end of file
+        return _INDIAN_TICKER_SUGGESTIONS
\ No newline at end of file
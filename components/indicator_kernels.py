@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import numba  # Optional JIT; pandas then runs rolling windows as compiled, GIL-releasing loops
+    _ROLLING_ENGINE = {'engine': 'numba', 'engine_kwargs': {'nopython': True, 'nogil': True, 'parallel': False}}
+except ImportError:
+    _ROLLING_ENGINE = {}
+
+def _ewm(values, min_periods=0, **kwargs):
+    """Recursive (adjust=False) exponential smoothing of a NumPy array"""
+    return pd.Series(values).ewm(min_periods=min_periods, adjust=False, **kwargs).mean().to_numpy()
+
+def sma_all(values, windows):
+    """Simple moving averages for several windows from one shared prefix sum, NaN-padded"""
+    if np.isnan(values).any():
+        # A NaN would poison every later prefix sum; rolling windows keep it local
+        series = pd.Series(values)
+        return {window: series.rolling(window=window).mean(**_ROLLING_ENGINE).to_numpy() for window in windows}
+    
+    prefix = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    averages = {}
+    for window in windows:
+        out = np.full(len(values), np.nan)
+        if len(values) >= window:
+            out[window - 1:] = (prefix[window:] - prefix[:-window]) / window
+        averages[window] = out
+    return averages
+
+def ema(values, window):
+    """Exponential moving average with the ta library's span and warm-up conventions"""
+    return _ewm(values, min_periods=window, span=window)
+
+def wilder_averages(close, window=14):
+    """Wilder-smoothed average gain and average loss of the close"""
+    delta = np.diff(close, prepend=np.nan)
+    avg_gain = _ewm(np.where(delta > 0, delta, 0.0), min_periods=window, alpha=1 / window)
+    avg_loss = _ewm(np.where(delta < 0, -delta, 0.0), min_periods=window, alpha=1 / window)
+    return avg_gain, avg_loss
+
+def rsi(close, window=14):
+    """Relative Strength Index using Wilder smoothing of gains and losses"""
+    avg_gain, avg_loss = wilder_averages(close, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+
+def macd(close, fast=12, slow=26, signal=9):
+    """MACD line, signal line and histogram"""
+    return macd_from_emas(ema(close, fast), ema(close, slow), signal)
+
+def macd_from_emas(fast_ema, slow_ema, signal=9):
+    """MACD line, signal line and histogram from already computed fast and slow EMAs"""
+    macd_line = fast_ema - slow_ema
+    signal_line = ema(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+def bollinger(close, window=20, window_dev=2):
+    """Bollinger upper, middle and lower bands from one rolling mean and population std"""
+    rolling = pd.Series(close).rolling(window=window)
+    middle = rolling.mean(**_ROLLING_ENGINE).to_numpy()
+    band = rolling.std(ddof=0, **_ROLLING_ENGINE).to_numpy() * window_dev
+    return middle + band, middle, middle - band
+
+def stochastic(high, low, close, k_window=14, d_window=3):
+    """Stochastic %K and %D, with each rolling extreme computed once"""
+    low_min = pd.Series(low).rolling(window=k_window).min(**_ROLLING_ENGINE).to_numpy()
+    high_max = pd.Series(high).rolling(window=k_window).max(**_ROLLING_ENGINE).to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stoch_k = (close - low_min) / (high_max - low_min) * 100
+    stoch_d = pd.Series(stoch_k).rolling(window=d_window).mean(**_ROLLING_ENGINE).to_numpy()
+    return stoch_k, stoch_d
+
+def atr(high, low, close, window=14):
+    """Average True Range, Wilder-smoothed and seeded with the mean of the first window"""
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    true_range = np.fmax.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+    out = np.zeros(len(close))
+    if len(close) >= window:
+        seeded = np.concatenate(([true_range[:window].mean()], true_range[window:]))
+        out[window - 1:] = _ewm(seeded, alpha=1 / window)
+    return out
+
+def obv(close, volume):
+    """On-Balance Volume; volume is added on up closes, subtracted on down closes, and unchanged closes leave it flat"""
+    return np.cumsum(np.sign(np.diff(close, prepend=close[0])) * volume)
+
+def vwap(high, low, close, volume):
+    """Cumulative VWAP, accumulated in place in a single output buffer"""
+    out = high + low
+    out += close
+    out /= 3
+    out *= volume
+    np.cumsum(out, out=out)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(out, np.cumsum(volume, dtype=np.float64), out=out)
+    return out
@@ -1,8 +1,165 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import heapq
+import html
 import os
+import re
+from collections import Counter, namedtuple
+from components.cache import CACHE_DIR, FileCache
+from components.data_loader import _yf, get_yf_session
+
+try:
+    import orjson  # Optional native JSON decoder
+except ImportError:
+    orjson = None
+
+NEWS_TTL = 900  # Providers refresh intraday news on roughly this cadence
+_news_cache = FileCache(os.path.join(CACHE_DIR, "news"))
+
+# Keywords for the basic sentiment tally, matched against whole words
+POSITIVE_KEYWORDS = frozenset({
+    'growth', 'profit', 'gain', 'increase', 'success', 'positive', 'up',
+    'bull', 'strong'
+})
+NEGATIVE_KEYWORDS = frozenset({
+    'loss', 'decline', 'decrease', 'fall', 'negative', 'down', 'bear', 'weak',
+    'crisis'
+})
+# +1/-1 per keyword, found with a single regex scan of each article
+_KEYWORD_SIGN = {
+    **{word: 1 for word in POSITIVE_KEYWORDS},
+    **{word: -1 for word in NEGATIVE_KEYWORDS}
+}
+_SENTIMENT_RE = re.compile(r"\b(" + "|".join(sorted(_KEYWORD_SIGN)) + r")\b")
+
+# One news article normalised across providers; optional fields are None when a provider lacks them
+Article = namedtuple('Article', [
+    'title', 'summary', 'snippet', 'url', 'source', 'published', 'image_url',
+    'related', 'keywords', 'sentiment', 'author', 'category'
+], defaults=(None, ) * 10)
+
+
+class NewsFetchError(Exception):
+    """A provider request failed; raised rather than returned so Streamlit never caches the failure"""
+
+
+@st.cache_resource
+def _news_session():
+    """Pooled keep-alive session shared by every news provider, so repeat calls skip the TCP/TLS handshake"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+    return session
+
+
+def _decode_json(response):
+    """Decode a JSON response body, with orjson when it is installed"""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _thumbnail_html(url):
+    """Lazy-loading thumbnail tag that hides itself if the image fails to load"""
+    return (f'<img src="{html.escape(url, quote=True)}" width="150" loading="lazy" '
+            'onerror="this.style.display=\'none\'">')
+
+
+def _format_published(values, **options):
+    """Parse every article timestamp in one vectorised call, as UTC display strings (None where missing)"""
+    times = pd.to_datetime(values, utc=True, errors='coerce', **options)
+    return [
+        text if isinstance(text, str) else None
+        for text in times.strftime('%Y-%m-%d %H:%M').tolist()
+    ]
+
+
+def _marketaux_articles(raw):
+    """Normalise MarketAux articles"""
+    published = _format_published([a.get('published_at') for a in raw],
+                                  format='ISO8601')
+    articles = []
+    for a, when in zip(raw, published):
+        entities = [
+            entity.get('symbol', entity.get('name', ''))
+            for entity in (a.get('entities') or [])[:3]
+        ]
+        articles.append(
+            Article(a.get('title', 'No title'),
+                    a.get('description'),
+                    snippet=a.get('snippet'),
+                    url=a.get('url'),
+                    source=a.get('source'),
+                    published=when,
+                    image_url=a.get('image_url'),
+                    related=', '.join(e for e in entities if e) or None,
+                    keywords=', '.join((a.get('keywords') or [])[:5]) or None,
+                    sentiment=a.get('sentiment')))
+    return articles
+
+
+def _yahoo_articles(raw):
+    """Normalise yfinance news items"""
+    published = _format_published(
+        [a.get('providerPublishTime') or None for a in raw], unit='s')
+    return [
+        Article(a.get('title', 'No title'),
+                a.get('summary'),
+                url=a.get('link'),
+                source=a.get('publisher'),
+                published=when,
+                related=', '.join(a.get('relatedTickers') or []) or None)
+        for a, when in zip(raw, published)
+    ]
+
+
+def _newsapi_articles(raw):
+    """Normalise NewsAPI articles, trimming content to a 200 character preview"""
+    published = _format_published([a.get('publishedAt') for a in raw],
+                                  format='ISO8601')
+    articles = []
+    for a, when in zip(raw, published):
+        content = a.get('content')
+        if content and len(content) > 200:
+            content = content[:200] + "..."
+        articles.append(
+            Article(a.get('title', 'No title'),
+                    a.get('description'),
+                    snippet=content,
+                    url=a.get('url'),
+                    source=(a.get('source') or {}).get('name'),
+                    published=when,
+                    image_url=a.get('urlToImage'),
+                    author=a.get('author')))
+    return articles
+
+
+def _finnhub_articles(raw, limit=15):
+    """Normalise Finnhub articles, the `limit` most recent first and the rest after in feed order"""
+    # Only the displayed head needs ordering; the tail still feeds the sentiment tally
+    newest = heapq.nlargest(limit,
+                            range(len(raw)),
+                            key=lambda i: raw[i].get('datetime', 0))
+    head = set(newest)
+    raw = [raw[i] for i in newest] + [
+        a for i, a in enumerate(raw) if i not in head
+    ]
+    published = _format_published([a.get('datetime') or None for a in raw],
+                                  unit='s')
+    return [
+        Article(a.get('headline', 'No title'),
+                a.get('summary'),
+                url=a.get('url'),
+                source=a.get('source'),
+                published=when,
+                image_url=a.get('image'),
+                related=a.get('related'),
+                category=a.get('category'))
+        for a, when in zip(raw, published)
+    ]
 
 
 class NewsAnalysis:
@@ -21,7 +178,7 @@ class NewsAnalysis:
         news_source = st.selectbox(
             "Select news source:", [
                 "MarketAux (Premium)", "Yahoo Finance (Free)", "NewsAPI",
-                "Finnhub"
+                "Finnhub", "All Sources"
             ],
             help=
             "MarketAux provides comprehensive financial news. Yahoo Finance is free but limited."
@@ -48,23 +205,75 @@ class NewsAnalysis:
                     "Finnhub API key not found. Please set FINNHUB_KEY environment variable."
                 )
                 st.info("You can get a free API key from: https://finnhub.io/")
+        elif news_source == "All Sources":
+            # Fetch every provider in parallel, then render each section from the results
+            with st.spinner("Fetching latest news from all sources..."):
+                results = self.fetch_all_news(ticker)
+
+            for provider, label, display in (
+                ('marketaux', "MarketAux", self.display_marketaux_news),
+                ('yahoo', "Yahoo Finance", self.display_yahoo_news),
+                ('newsapi', "NewsAPI", self.display_newsapi_news),
+                ('finnhub', "Finnhub", self.display_finnhub_news),
+            ):
+                st.subheader(label)
+                articles, error = results[provider]
+                if error:
+                    st.error(error)
+                display(ticker, articles)
+
+    def fetch_all_news(self, ticker):
+        """Fetch every provider concurrently; errors come back as messages for the script thread to show"""
+        fetchers = {
+            'marketaux': (self.fetch_marketaux_news, ticker, self.marketaux_key),
+            'yahoo': (self.fetch_yahoo_news, ticker),
+            'newsapi': (self.fetch_newsapi_news, ticker, self.newsapi_key),
+            'finnhub': (self.fetch_finnhub_news, ticker, self.finnhub_key),
+        }
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = {
+                executor.submit(*call): provider
+                for provider, call in fetchers.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = (future.result(), None)
+                except NewsFetchError as e:
+                    results[futures[future]] = ([], str(e))
+        return results
+
+    def _fetch_reporting_errors(self, fetch, *args):
+        """Call a cached fetcher, showing any failure on the script thread and returning []"""
+        try:
+            return fetch(*args)
+        except NewsFetchError as e:
+            st.error(str(e))
+            return []
 
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
+    @st.cache_data(ttl=NEWS_TTL, show_spinner=False)  # Cache for 15 minutes
     def fetch_yahoo_news(_self, ticker):
         """Fetch news using Yahoo Finance (via yfinance)"""
         try:
-            import yfinance as yf
-            stock = yf.Ticker(ticker)
-            news = stock.news
-            return news
+            news = _news_cache.get_or_fetch(
+                f"{ticker}:yahoo",
+                lambda: _yf().Ticker(ticker, session=get_yf_session()).news,
+                ttl=NEWS_TTL)
+            return _yahoo_articles(news or [])
         except Exception as e:
-            st.error(f"Error fetching Yahoo Finance news: {str(e)}")
-            return []
+            raise NewsFetchError(
+                f"Error fetching Yahoo Finance news: {str(e)}") from e
 
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
+    @st.cache_data(ttl=NEWS_TTL, show_spinner=False)  # Cache for 15 minutes
     def fetch_marketaux_news(_self, ticker, api_key):
         """Fetch news using MarketAux API"""
         try:
+            # The disk cache outlives restarts, so rate-limited providers aren't re-hit on every deploy
+            cache_key = f"{ticker}:marketaux"
+            cached = _news_cache.get(cache_key, NEWS_TTL)
+            if cached is not None:
+                return _marketaux_articles(cached)
+
             url = "https://api.marketaux.com/v1/news/all"
             params = {
                 'symbols': ticker.replace('.NS',
@@ -75,25 +284,34 @@ class NewsAnalysis:
                 'api_token': api_key
             }
 
-            response = requests.get(url, params=params)
+            response = _news_session().get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
-                return data.get('data', [])
+                data = _decode_json(response)
+                articles = data.get('data', [])
+                if articles:
+                    _news_cache.set(cache_key, articles)
+                return _marketaux_articles(articles)
             else:
-                st.error(
+                raise NewsFetchError(
                     f"MarketAux API error: {response.status_code} - {response.text}"
                 )
-                return []
 
+        except NewsFetchError:
+            raise
         except Exception as e:
-            st.error(f"Error fetching MarketAux news: {str(e)}")
-            return []
+            raise NewsFetchError(
+                f"Error fetching MarketAux news: {str(e)}") from e
 
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
+    @st.cache_data(ttl=NEWS_TTL, show_spinner=False)  # Cache for 15 minutes
     def fetch_newsapi_news(_self, ticker, api_key):
         """Fetch news using NewsAPI"""
         try:
+            cache_key = f"{ticker}:newsapi"
+            cached = _news_cache.get(cache_key, NEWS_TTL)
+            if cached is not None:
+                return _newsapi_articles(cached)
+
             url = "https://newsapi.org/v2/everything"
             params = {
                 'q': f'{ticker} stock',
@@ -103,23 +321,32 @@ class NewsAnalysis:
                 'apiKey': api_key
             }
 
-            response = requests.get(url, params=params)
+            response = _news_session().get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
-                return data.get('articles', [])
+                data = _decode_json(response)
+                articles = data.get('articles', [])
+                if articles:
+                    _news_cache.set(cache_key, articles)
+                return _newsapi_articles(articles)
             else:
-                st.error(f"NewsAPI error: {response.status_code}")
-                return []
+                raise NewsFetchError(f"NewsAPI error: {response.status_code}")
 
+        except NewsFetchError:
+            raise
         except Exception as e:
-            st.error(f"Error fetching NewsAPI news: {str(e)}")
-            return []
+            raise NewsFetchError(
+                f"Error fetching NewsAPI news: {str(e)}") from e
 
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
+    @st.cache_data(ttl=NEWS_TTL, show_spinner=False)  # Cache for 15 minutes
     def fetch_finnhub_news(_self, ticker, api_key):
         """Fetch news using Finnhub"""
         try:
+            cache_key = f"{ticker}:finnhub"
+            cached = _news_cache.get(cache_key, NEWS_TTL)
+            if cached is not None:
+                return _finnhub_articles(cached)
+
             # Get date range (last 7 days)
             end_date = datetime.now()
             start_date = end_date - timedelta(days=7)
@@ -132,22 +359,28 @@ class NewsAnalysis:
                 'token': api_key
             }
 
-            response = requests.get(url, params=params)
+            response = _news_session().get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                return response.json()
+                articles = _decode_json(response)
+                if articles:
+                    _news_cache.set(cache_key, articles)
+                return _finnhub_articles(articles)
             else:
-                st.error(f"Finnhub API error: {response.status_code}")
-                return []
+                raise NewsFetchError(f"Finnhub API error: {response.status_code}")
 
+        except NewsFetchError:
+            raise
         except Exception as e:
-            st.error(f"Error fetching Finnhub news: {str(e)}")
-            return []
+            raise NewsFetchError(
+                f"Error fetching Finnhub news: {str(e)}") from e
 
-    def display_marketaux_news(self, ticker):
+    def display_marketaux_news(self, ticker, news_data=None):
         """Display MarketAux news"""
-        with st.spinner("Fetching latest news from MarketAux..."):
-            news_data = self.fetch_marketaux_news(ticker, self.marketaux_key)
+        if news_data is None:
+            with st.spinner("Fetching latest news from MarketAux..."):
+                news_data = self._fetch_reporting_errors(
+                    self.fetch_marketaux_news, ticker, self.marketaux_key)
 
         if not news_data:
             st.warning(
@@ -159,71 +392,57 @@ class NewsAnalysis:
 
         # Display news articles
         for i, article in enumerate(news_data[:15]):  # Show first 15 articles
-            with st.expander(f"📰 {article.get('title', 'No title')}",
-                             expanded=i < 3):
+            with st.expander(f"📰 {article.title}", expanded=i < 3):
                 col1, col2 = st.columns([3, 1])
 
                 with col1:
                     # Article description
-                    if article.get('description'):
-                        st.write(article['description'])
+                    if article.summary:
+                        st.write(article.summary)
 
                     # Article snippet
-                    if article.get('snippet'):
-                        st.write(f"*{article['snippet']}*")
+                    if article.snippet:
+                        st.write(f"*{article.snippet}*")
 
                     # Article link
-                    if article.get('url'):
-                        st.markdown(f"[Read full article]({article['url']})")
+                    if article.url:
+                        st.markdown(f"[Read full article]({article.url})")
 
-                    # Keywords/tags
-                    if article.get('keywords'):
-                        keywords = article['keywords'][:5]  # First 5 keywords
-                        if keywords:
-                            st.write(f"**Keywords:** {', '.join(keywords)}")
+                    # Keywords/tags (first 5)
+                    if article.keywords:
+                        st.write(f"**Keywords:** {article.keywords}")
 
                 with col2:
                     # Source and date
-                    if article.get('source'):
-                        st.write(f"**Source:** {article['source']}")
+                    if article.source:
+                        st.write(f"**Source:** {article.source}")
 
-                    if article.get('published_at'):
-                        pub_time = datetime.fromisoformat(
-                            article['published_at'].replace('Z', '+00:00'))
-                        st.write(
-                            f"**Published:** {pub_time.strftime('%Y-%m-%d %H:%M')}"
-                        )
+                    if article.published:
+                        st.write(f"**Published:** {article.published}")
 
                     # Entities (companies mentioned)
-                    if article.get('entities'):
-                        entities = [
-                            entity.get('symbol', entity.get('name', ''))
-                            for entity in article['entities'][:3]
-                        ]
-                        entities = [e for e in entities
-                                    if e]  # Remove empty strings
-                        if entities:
-                            st.write(f"**Related:** {', '.join(entities)}")
+                    if article.related:
+                        st.write(f"**Related:** {article.related}")
 
                     # Sentiment if available
-                    if article.get('sentiment'):
-                        sentiment = article['sentiment']
+                    if article.sentiment:
+                        sentiment = article.sentiment
                         sentiment_color = "green" if sentiment > 0 else "red" if sentiment < 0 else "gray"
                         st.markdown(
                             f"**Sentiment:** <span style='color: {sentiment_color}'>{sentiment:.2f}</span>",
                             unsafe_allow_html=True)
 
-                    # Image
-                    if article.get('image_url'):
-                        try:
-                            st.image(article['image_url'], width=150)
-                        except:
-                            pass  # Ignore image loading errors
+                    # Image, fetched by the browser only when scrolled into view
+                    if article.image_url:
+                        st.markdown(_thumbnail_html(article.image_url),
+                                    unsafe_allow_html=True)
 
-    def display_yahoo_news(self, ticker):
+    def display_yahoo_news(self, ticker, news_data=None):
         """Display Yahoo Finance news"""
-        with st.spinner("Fetching latest news..."):
-            news_data = self.fetch_yahoo_news(ticker)
+        if news_data is None:
+            with st.spinner("Fetching latest news..."):
+                news_data = self._fetch_reporting_errors(
+                    self.fetch_yahoo_news, ticker)
 
         if not news_data:
             st.warning("No news articles found or error fetching data.")
@@ -233,41 +452,36 @@ class NewsAnalysis:
 
         # Display news articles
         for i, article in enumerate(news_data[:10]):  # Show first 10 articles
-            with st.expander(f"📰 {article.get('title', 'No title')}",
-                             expanded=i < 3):
+            with st.expander(f"📰 {article.title}", expanded=i < 3):
                 col1, col2 = st.columns([3, 1])
 
                 with col1:
                     # Article summary
-                    if article.get('summary'):
-                        st.write(article['summary'])
+                    if article.summary:
+                        st.write(article.summary)
 
                     # Article link
-                    if article.get('link'):
-                        st.markdown(f"[Read full article]({article['link']})")
+                    if article.url:
+                        st.markdown(f"[Read full article]({article.url})")
 
                 with col2:
                     # Publisher and date
-                    if article.get('publisher'):
-                        st.write(f"**Publisher:** {article['publisher']}")
+                    if article.source:
+                        st.write(f"**Publisher:** {article.source}")
 
-                    if article.get('providerPublishTime'):
-                        pub_time = datetime.fromtimestamp(
-                            article['providerPublishTime'])
-                        st.write(
-                            f"**Published:** {pub_time.strftime('%Y-%m-%d %H:%M')}"
-                        )
+                    if article.published:
+                        st.write(f"**Published:** {article.published}")
 
                     # Related tickers
-                    if article.get('relatedTickers'):
-                        st.write(
-                            f"**Related:** {', '.join(article['relatedTickers'])}"
-                        )
+                    if article.related:
+                        st.write(f"**Related:** {article.related}")
 
-    def display_newsapi_news(self, ticker):
+    def display_newsapi_news(self, ticker, news_data=None):
         """Display NewsAPI news"""
-        with st.spinner("Fetching latest news..."):
-            news_data = self.fetch_newsapi_news(ticker, self.newsapi_key)
+        if news_data is None:
+            with st.spinner("Fetching latest news..."):
+                news_data = self._fetch_reporting_errors(
+                    self.fetch_newsapi_news, ticker, self.newsapi_key)
 
         if not news_data:
             st.warning("No news articles found or error fetching data.")
@@ -277,54 +491,45 @@ class NewsAnalysis:
 
         # Display news articles
         for i, article in enumerate(news_data[:15]):  # Show first 15 articles
-            with st.expander(f"📰 {article.get('title', 'No title')}",
-                             expanded=i < 3):
+            with st.expander(f"📰 {article.title}", expanded=i < 3):
                 col1, col2 = st.columns([3, 1])
 
                 with col1:
                     # Article description
-                    if article.get('description'):
-                        st.write(article['description'])
+                    if article.summary:
+                        st.write(article.summary)
 
                     # Article content preview
-                    if article.get('content'):
-                        content_preview = article[
-                            'content'][:200] + "..." if len(
-                                article['content']
-                            ) > 200 else article['content']
-                        st.write(f"*{content_preview}*")
+                    if article.snippet:
+                        st.write(f"*{article.snippet}*")
 
                     # Article link
-                    if article.get('url'):
-                        st.markdown(f"[Read full article]({article['url']})")
+                    if article.url:
+                        st.markdown(f"[Read full article]({article.url})")
 
                 with col2:
                     # Source and date
-                    if article.get('source', {}).get('name'):
-                        st.write(f"**Source:** {article['source']['name']}")
+                    if article.source:
+                        st.write(f"**Source:** {article.source}")
 
-                    if article.get('publishedAt'):
-                        pub_time = datetime.fromisoformat(
-                            article['publishedAt'].replace('Z', '+00:00'))
-                        st.write(
-                            f"**Published:** {pub_time.strftime('%Y-%m-%d %H:%M')}"
-                        )
+                    if article.published:
+                        st.write(f"**Published:** {article.published}")
 
                     # Author
-                    if article.get('author'):
-                        st.write(f"**Author:** {article['author']}")
+                    if article.author:
+                        st.write(f"**Author:** {article.author}")
 
-                    # Image
-                    if article.get('urlToImage'):
-                        try:
-                            st.image(article['urlToImage'], width=150)
-                        except:
-                            pass  # Skip if image fails to load
+                    # Image, fetched by the browser only when scrolled into view
+                    if article.image_url:
+                        st.markdown(_thumbnail_html(article.image_url),
+                                    unsafe_allow_html=True)
 
-    def display_finnhub_news(self, ticker):
+    def display_finnhub_news(self, ticker, news_data=None):
         """Display Finnhub news"""
-        with st.spinner("Fetching latest news..."):
-            news_data = self.fetch_finnhub_news(ticker, self.finnhub_key)
+        if news_data is None:
+            with st.spinner("Fetching latest news..."):
+                news_data = self._fetch_reporting_errors(
+                    self.fetch_finnhub_news, ticker, self.finnhub_key)
 
         if not news_data:
             st.warning("No news articles found or error fetching data.")
@@ -332,51 +537,40 @@ class NewsAnalysis:
 
         st.info(f"Found {len(news_data)} news articles")
 
-        # Sort by datetime (most recent first)
-        news_data = sorted(news_data,
-                           key=lambda x: x.get('datetime', 0),
-                           reverse=True)
-
-        # Display news articles
+        # Display news articles (the first 15 are already most recent first)
         for i, article in enumerate(news_data[:15]):  # Show first 15 articles
-            with st.expander(f"📰 {article.get('headline', 'No title')}",
-                             expanded=i < 3):
+            with st.expander(f"📰 {article.title}", expanded=i < 3):
                 col1, col2 = st.columns([3, 1])
 
                 with col1:
                     # Article summary
-                    if article.get('summary'):
-                        st.write(article['summary'])
+                    if article.summary:
+                        st.write(article.summary)
 
                     # Article link
-                    if article.get('url'):
-                        st.markdown(f"[Read full article]({article['url']})")
+                    if article.url:
+                        st.markdown(f"[Read full article]({article.url})")
 
                 with col2:
                     # Source and date
-                    if article.get('source'):
-                        st.write(f"**Source:** {article['source']}")
+                    if article.source:
+                        st.write(f"**Source:** {article.source}")
 
-                    if article.get('datetime'):
-                        pub_time = datetime.fromtimestamp(article['datetime'])
-                        st.write(
-                            f"**Published:** {pub_time.strftime('%Y-%m-%d %H:%M')}"
-                        )
+                    if article.published:
+                        st.write(f"**Published:** {article.published}")
 
                     # Category
-                    if article.get('category'):
-                        st.write(f"**Category:** {article['category']}")
+                    if article.category:
+                        st.write(f"**Category:** {article.category}")
 
                     # Related symbols
-                    if article.get('related'):
-                        st.write(f"**Related:** {article['related']}")
+                    if article.related:
+                        st.write(f"**Related:** {article.related}")
 
-                    # Image
-                    if article.get('image'):
-                        try:
-                            st.image(article['image'], width=150)
-                        except:
-                            pass  # Skip if image fails to load
+                    # Image, fetched by the browser only when scrolled into view
+                    if article.image_url:
+                        st.markdown(_thumbnail_html(article.image_url),
+                                    unsafe_allow_html=True)
 
         # News sentiment analysis (if available)
         self.display_news_sentiment(news_data)
@@ -388,37 +582,23 @@ class NewsAnalysis:
 
         st.subheader("📊 News Sentiment Analysis")
 
-        # Simple keyword-based sentiment analysis
-        positive_keywords = [
-            'growth', 'profit', 'gain', 'increase', 'success', 'positive',
-            'up', 'bull', 'strong'
-        ]
-        negative_keywords = [
-            'loss', 'decline', 'decrease', 'fall', 'negative', 'down', 'bear',
-            'weak', 'crisis'
-        ]
-
+        # Simple keyword-based sentiment analysis: one scan per article nets positive against negative keywords
         sentiment_scores = []
 
         for article in news_data:
-            text = f"{article.get('headline', '')} {article.get('summary', '')}".lower(
-            )
-
-            positive_count = sum(1 for word in positive_keywords
-                                 if word in text)
-            negative_count = sum(1 for word in negative_keywords
-                                 if word in text)
+            text = f"{article.title} {article.summary or ''}".lower()
+            score = sum(_KEYWORD_SIGN[match.group(1)]
+                        for match in _SENTIMENT_RE.finditer(text))
 
-            if positive_count > negative_count:
+            if score > 0:
                 sentiment_scores.append('Positive')
-            elif negative_count > positive_count:
+            elif score < 0:
                 sentiment_scores.append('Negative')
             else:
                 sentiment_scores.append('Neutral')
 
         if sentiment_scores:
-            sentiment_df = pd.DataFrame({'Sentiment': sentiment_scores})
-            sentiment_counts = sentiment_df['Sentiment'].value_counts()
+            sentiment_counts = Counter(sentiment_scores)
 
             col1, col2, col3 = st.columns(3)
 
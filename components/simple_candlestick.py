@@ -3,6 +3,37 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from components.data_processor import _invalid_ohlcv_mask
+
+CHART_MAX_BARS = 2000  # Longer histories are merged into this many OHLC bars so the browser stays responsive
+
+@st.cache_resource(max_entries=32)
+def _chart_skeleton(title):
+    """Price/volume subplot grid with layout and axis titles, built once per chart title"""
+    # Create subplots
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.1,
+        subplot_titles=(f'{title}', 'Volume'),
+        row_heights=[0.7, 0.3]
+    )
+    
+    # Update layout
+    fig.update_layout(
+        title=title,
+        xaxis_rangeslider_visible=False,
+        height=700,
+        showlegend=True,
+        template="plotly_white",
+        hovermode='x unified'
+    )
+    
+    # Update axes
+    fig.update_xaxes(title_text="Date", row=2, col=1)
+    fig.update_yaxes(title_text="Price", row=1, col=1)
+    fig.update_yaxes(title_text="Volume", row=2, col=1)
+    return fig
 
 class SimpleCandlestickChart:
     def __init__(self):
@@ -11,61 +42,58 @@ class SimpleCandlestickChart:
     def create_chart(self, df, title="Candlestick Chart"):
         """Create a simple candlestick chart with volume"""
         try:
-            # Clean data thoroughly
-            df_clean = df.copy()
+            # Ensure Date column is datetime; the caller's frame is only read, never modified
+            dates = df['Date']
+            if not pd.api.types.is_datetime64_any_dtype(dates):
+                dates = pd.to_datetime(dates)
             
-            # Remove infinite values
-            df_clean = df_clean.replace([np.inf, -np.inf], np.nan)
-            
-            # Ensure Date column is datetime
-            if not pd.api.types.is_datetime64_any_dtype(df_clean['Date']):
-                df_clean['Date'] = pd.to_datetime(df_clean['Date'])
-            
-            # Ensure numeric columns are properly typed
+            # Ensure numeric columns are properly typed, as plain float arrays
             numeric_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
+            values = {col: pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64) for col in numeric_cols}
+            
+            # One mask for missing dates, missing or infinite values and invalid price relationships
+            valid = dates.notna().to_numpy(copy=True)
             for col in numeric_cols:
-                if col in df_clean.columns:
-                    df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
-            
-            # Remove rows with missing essential data
-            df_clean = df_clean.dropna(subset=['Date', 'Open', 'High', 'Low', 'Close', 'Volume'])
-            
-            # Validate price relationships
-            df_clean = df_clean[
-                (df_clean['High'] >= df_clean['Low']) & 
-                (df_clean['High'] >= df_clean['Open']) & 
-                (df_clean['High'] >= df_clean['Close']) &
-                (df_clean['Low'] <= df_clean['Open']) & 
-                (df_clean['Low'] <= df_clean['Close']) &
-                (df_clean['Volume'] >= 0) &
-                (df_clean['Open'] > 0) & (df_clean['High'] > 0) & 
-                (df_clean['Low'] > 0) & (df_clean['Close'] > 0)
-            ]
-            
-            if df_clean.empty:
+                valid &= np.isfinite(values[col])
+            valid &= ~_invalid_ohlcv_mask(*values.values())
+            
+            if not valid.any():
                 st.error("No valid data available for chart after cleaning.")
                 return
             
-            # Sort by date
-            df_clean = df_clean.sort_values('Date').reset_index(drop=True)
-            
-            # Create subplots
-            fig = make_subplots(
-                rows=2, cols=1,
-                shared_xaxes=True,
-                vertical_spacing=0.1,
-                subplot_titles=(f'{title}', 'Volume'),
-                row_heights=[0.7, 0.3]
-            )
+            # Surviving row positions in date order, so the chart frame is built once, already sorted
+            rows = np.flatnonzero(valid)
+            rows = rows[dates.array[rows].argsort(kind='stable')]
+            
+            # Plotly ships numeric arrays to the browser as typed arrays; float32 prices halve that payload
+            # with no visible loss, and volume is a share count
+            df_clean = pd.DataFrame({
+                'Date': dates.array[rows],
+                **{col: values[col][rows].astype(np.float32) for col in ['Open', 'High', 'Low', 'Close']},
+                'Volume': values['Volume'][rows].astype(np.int64)
+            })
+            
+            # Merge consecutive records into wider OHLC bars for long histories; the summary below still uses every record
+            chart_df = df_clean
+            if len(df_clean) > CHART_MAX_BARS:
+                bucket = -(-len(df_clean) // CHART_MAX_BARS)
+                chart_df = df_clean.groupby(df_clean.index // bucket).agg(
+                    {'Date': 'first', 'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+                )
+                st.caption(f"Showing {len(chart_df):,} bars, each combining up to {bucket} records.")
+            open_, high, low, close = (chart_df[col].to_numpy() for col in ['Open', 'High', 'Low', 'Close'])
+            
+            # Start from a copy of the cached skeleton; the cached figure is shared across sessions, so it is never mutated
+            fig = go.Figure(_chart_skeleton(title))
             
             # Candlestick chart
             fig.add_trace(
                 go.Candlestick(
-                    x=df_clean['Date'],
-                    open=df_clean['Open'],
-                    high=df_clean['High'],
-                    low=df_clean['Low'],
-                    close=df_clean['Close'],
+                    x=chart_df['Date'],
+                    open=open_,
+                    high=high,
+                    low=low,
+                    close=close,
                     name="OHLC",
                     increasing_line_color='green',
                     decreasing_line_color='red',
@@ -76,13 +104,12 @@ class SimpleCandlestickChart:
             )
             
             # Volume chart with colors matching price movement
-            colors = ['green' if close >= open else 'red' 
-                     for close, open in zip(df_clean['Close'], df_clean['Open'])]
+            colors = np.where(close >= open_, 'green', 'red').tolist()
             
             fig.add_trace(
                 go.Bar(
-                    x=df_clean['Date'],
-                    y=df_clean['Volume'],
+                    x=chart_df['Date'],
+                    y=chart_df['Volume'].to_numpy(),
                     name="Volume",
                     marker_color=colors,
                     opacity=0.7,
@@ -91,21 +118,6 @@ class SimpleCandlestickChart:
                 row=2, col=1
             )
             
-            # Update layout
-            fig.update_layout(
-                title=title,
-                xaxis_rangeslider_visible=False,
-                height=700,
-                showlegend=True,
-                template="plotly_white",
-                hovermode='x unified'
-            )
-            
-            # Update axes
-            fig.update_xaxes(title_text="Date", row=2, col=1)
-            fig.update_yaxes(title_text="Price", row=1, col=1)
-            fig.update_yaxes(title_text="Volume", row=2, col=1)
-            
             # Display chart
             st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True})
             
@@ -0,0 +1,94 @@
+import numpy as np
+from collections import namedtuple
+from components import indicator_kernels as kernels
+
+# Longest lookback of any indicator; shorter histories are simply recomputed in full
+MIN_SEED_BARS = 50
+
+# Running indicator state after the last processed bar: the trailing windows each rolling
+# indicator needs plus the current value of every exponential average
+IndicatorState = namedtuple('IndicatorState', [
+    'closes', 'highs', 'lows', 'volumes', 'stoch_k',
+    'ema_12', 'ema_26', 'macd_signal', 'avg_gain', 'avg_loss'
+])
+
+def _ema_step(previous, value, span=None, alpha=None):
+    """One step of the recursive (adjust=False) exponential average"""
+    alpha = 2 / (span + 1) if alpha is None else alpha
+    return (1 - alpha) * previous + alpha * value
+
+def seed(close, high, low, volume, columns):
+    """State after the last bar of a fully computed history, or None if it is too short or has gaps"""
+    if len(close) < MIN_SEED_BARS or not all(np.isfinite(values).all() for values in (close, high, low, volume)):
+        return None
+    
+    avg_gain, avg_loss = kernels.wilder_averages(close, 14)
+    return IndicatorState(
+        closes=close[-50:].copy(),
+        highs=high[-14:].copy(),
+        lows=low[-14:].copy(),
+        volumes=volume[-20:].copy(),
+        stoch_k=columns['Stoch_K'][-3:].copy(),
+        ema_12=columns['EMA_12'][-1],
+        ema_26=columns['EMA_26'][-1],
+        macd_signal=columns['MACD_signal'][-1],
+        avg_gain=avg_gain[-1],
+        avg_loss=avg_loss[-1]
+    )
+
+def update(state, bar):
+    """Advance the state by one (close, high, low, volume) bar, returning the new state and that bar's indicators"""
+    close, high, low, volume = bar
+    closes = np.append(state.closes[1:], close)
+    highs = np.append(state.highs[1:], high)
+    lows = np.append(state.lows[1:], low)
+    volumes = np.append(state.volumes[1:], volume)
+    
+    # Exponential averages only need their previous value
+    ema_12 = _ema_step(state.ema_12, close, span=12)
+    ema_26 = _ema_step(state.ema_26, close, span=26)
+    macd_line = ema_12 - ema_26
+    macd_signal = _ema_step(state.macd_signal, macd_line, span=9)
+    
+    # Wilder-smoothed gains and losses for the RSI
+    delta = close - state.closes[-1]
+    avg_gain = _ema_step(state.avg_gain, max(delta, 0.0), alpha=1 / 14)
+    avg_loss = _ema_step(state.avg_loss, max(-delta, 0.0), alpha=1 / 14)
+    rsi = 100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss)
+    
+    # Rolling windows are re-reduced from their short trailing buffers
+    bb_window = closes[-20:]
+    bb_middle = bb_window.mean()
+    bb_band = bb_window.std() * 2
+    low_min, high_max = lows.min(), highs.max()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = (close - low_min) / (high_max - low_min) * 100
+    stoch_k = np.append(state.stoch_k[1:], k)
+    
+    state = IndicatorState(closes, highs, lows, volumes, stoch_k, ema_12, ema_26, macd_signal, avg_gain, avg_loss)
+    row = {
+        'SMA_20': bb_middle,
+        'SMA_50': closes.mean(),
+        'EMA_12': ema_12,
+        'EMA_26': ema_26,
+        'RSI': rsi,
+        'MACD': macd_line,
+        'MACD_signal': macd_signal,
+        'MACD_histogram': macd_line - macd_signal,
+        'BB_upper': bb_middle + bb_band,
+        'BB_middle': bb_middle,
+        'BB_lower': bb_middle - bb_band,
+        'Volume_SMA': volumes.mean(),
+        'Stoch_K': k,
+        'Stoch_D': stoch_k.mean()
+    }
+    return state, row
+
+def extend(state, close, high, low, volume):
+    """Run update over newly appended bars, returning the final state and their indicator columns"""
+    rows = []
+    for bar in zip(close, high, low, volume):
+        state, row = update(state, bar)
+        rows.append(row)
+    columns = {name: np.array([row[name] for row in rows], dtype=np.float64) for name in rows[0]} if rows else {}
+    return state, columns
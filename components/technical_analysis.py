@@ -2,12 +2,307 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import ta
-import ta.trend
-import ta.momentum
-import ta.volatility
-import ta.volume
 import numpy as np
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from components import indicator_kernels as kernels
+from components import ta_incremental
+from components.data_processor import _invalid_ohlcv_mask
+
+try:
+    import zstandard  # Optional; pandas writes zstd through it
+    EXPORT_COMPRESSION = ({'method': 'zstd', 'level': 3}, 'zst', 'application/zstd')
+except ImportError:
+    EXPORT_COMPRESSION = ({'method': 'gzip', 'compresslevel': 6, 'mtime': 0}, 'gz', 'application/gzip')
+
+OHLCV_INPUTS = ['Close', 'High', 'Low', 'Volume']
+PARALLEL_MIN_BARS = 200000  # History length from which indicator kernels run concurrently
+# Latest values the signals and summary read, unpacked from the last row in this order
+LATEST_COLUMNS = ['Close', 'SMA_20', 'SMA_50', 'RSI', 'MACD', 'MACD_signal', 'Stoch_K',
+                  'BB_upper', 'BB_lower', 'Volume', 'Volume_SMA']
+# Summary sentiment label, indexed by the sign of bullish minus bearish signals
+SENTIMENT_LABELS = ("🔴 BEARISH", "🟡 NEUTRAL", "🟢 BULLISH")
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _compute_indicators(close, high, low, volume):
+    """Indicator columns from the raw bytes of float64 OHLCV arrays, keyed only on those bytes"""
+    # Every indicator comes from the shared NumPy kernels over raw arrays, so the close is read once
+    # and each rolling window or EMA is computed once instead of once per ta call
+    close, high, low, volume = (np.frombuffer(values, dtype=np.float64) for values in (close, high, low, volume))
+    
+    # Each kernel reads only the raw arrays, so they are independent jobs
+    jobs = {
+        'sma': partial(kernels.sma_all, close, [20, 50]),  # Moving Averages
+        'ema_12': partial(kernels.ema, close, 12),
+        'ema_26': partial(kernels.ema, close, 26),
+        'rsi': partial(kernels.rsi, close, 14),
+        'bollinger': partial(kernels.bollinger, close, 20, 2),
+        'stochastic': partial(kernels.stochastic, high, low, close, k_window=14, d_window=3),
+        # Volume indicators - 20-day average from one cumulative sum rather than a rolling window
+        'volume_sma': partial(kernels.sma_all, volume, [20])
+    }
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if len(close) >= PARALLEL_MIN_BARS and workers > 1:
+        # The pandas and NumPy loops inside the kernels release the GIL, so very long histories
+        # are computed across cores
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = dict(zip(jobs, executor.map(lambda job: job(), jobs.values())))
+    else:
+        results = {name: job() for name, job in jobs.items()}
+    
+    sma = results['sma']
+    # MACD reuses the 12/26 EMAs above rather than recomputing them
+    macd_line, macd_signal, macd_histogram = kernels.macd_from_emas(results['ema_12'], results['ema_26'], signal=9)
+    bb_upper, bb_middle, bb_lower = results['bollinger']
+    stoch_k, stoch_d = results['stochastic']
+    
+    return {
+        'SMA_20': sma[20],
+        'SMA_50': sma[50],
+        'EMA_12': results['ema_12'],
+        'EMA_26': results['ema_26'],
+        'RSI': results['rsi'],
+        'MACD': macd_line,
+        'MACD_signal': macd_signal,
+        'MACD_histogram': macd_histogram,
+        'BB_upper': bb_upper,
+        'BB_middle': bb_middle,
+        'BB_lower': bb_lower,
+        'Volume_SMA': results['volume_sma'][20],
+        'Stoch_K': stoch_k,
+        'Stoch_D': stoch_d
+    }
+
+def _plot_dates(dates):
+    """Naive datetime64 array for Plotly x-axes"""
+    dates = pd.to_datetime(dates)
+    # plotly.js ignores UTC offsets anyway, and tz-aware values serialize one by one
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    return dates.to_numpy()
+
+def _frame_fingerprint(df):
+    """Cheap content fingerprint of the OHLCV columns, keying cached figures in place of the frame"""
+    ohlcv = df[['Date', 'Open', 'High', 'Low', 'Close', 'Volume']]
+    return len(df), int(pd.util.hash_pandas_object(ohlcv, index=False).sum())
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _candlestick_figure(_df, ticker, fingerprint):
+    """Technical chart for a frame, or None if no valid rows remain; cached on the ticker and data fingerprint"""
+    # More thorough data cleaning to prevent infinite extent warnings
+    # Remove infinite values; replace returns a new frame sharing the unchanged columns, so no upfront copy
+    df_clean = _df.replace([np.inf, -np.inf], np.nan)
+    
+    # Ensure Date column is datetime
+    if not pd.api.types.is_datetime64_any_dtype(df_clean['Date']):
+        df_clean['Date'] = pd.to_datetime(df_clean['Date'])
+    
+    # Ensure numeric columns are properly typed; loaders already hand over numbers, so usually none need converting
+    numeric_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
+    non_numeric = [col for col in numeric_cols if col in df_clean.columns and not pd.api.types.is_numeric_dtype(df_clean[col])]
+    if non_numeric:
+        df_clean[non_numeric] = df_clean[non_numeric].apply(pd.to_numeric, errors='coerce')
+    
+    # Remove rows with any missing essential data or illogical price relationships, with one
+    # fused mask over the raw arrays and a single row selection
+    values = df_clean[numeric_cols].to_numpy(np.float64)
+    valid = df_clean['Date'].notna().to_numpy(copy=True)
+    valid &= ~np.isnan(values).any(axis=1)
+    valid &= ~_invalid_ohlcv_mask(*values.T)
+    df_clean = df_clean[valid]
+    
+    if df_clean.empty:
+        return None
+    
+    # Sort by date for proper chronological order
+    df_clean = df_clean.sort_values('Date').reset_index(drop=True)
+    
+    # Hand Plotly raw NumPy arrays, which it serializes in bulk rather than per element
+    dates = _plot_dates(df_clean['Date'])
+    open_, high, low, close, volume = (df_clean[col].to_numpy() for col in numeric_cols)
+    
+    # Create subplot figure
+    fig = make_subplots(
+        rows=3, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.05,
+        row_heights=[0.6, 0.2, 0.2],
+        subplot_titles=('Price', 'Volume', 'RSI')
+    )
+    
+    # Candlestick chart
+    fig.add_trace(
+        go.Candlestick(
+            x=dates,
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            name='Price'
+        ),
+        row=1, col=1
+    )
+    
+    # Moving averages
+    if 'SMA_20' in df_clean.columns:
+        fig.add_trace(
+            go.Scattergl(
+                x=dates,
+                y=df_clean['SMA_20'].to_numpy(),
+                mode='lines',
+                name='SMA 20',
+                line=dict(color='orange', width=1)
+            ),
+            row=1, col=1
+        )
+    
+    if 'SMA_50' in df_clean.columns:
+        fig.add_trace(
+            go.Scattergl(
+                x=dates,
+                y=df_clean['SMA_50'].to_numpy(),
+                mode='lines',
+                name='SMA 50',
+                line=dict(color='blue', width=1)
+            ),
+            row=1, col=1
+        )
+    
+    # Bollinger Bands
+    if 'BB_upper' in df_clean.columns and 'BB_lower' in df_clean.columns:
+        fig.add_trace(
+            go.Scattergl(
+                x=dates,
+                y=df_clean['BB_upper'].to_numpy(),
+                mode='lines',
+                name='BB Upper',
+                line=dict(color='gray', width=1, dash='dash')
+            ),
+            row=1, col=1
+        )
+        
+        fig.add_trace(
+            go.Scattergl(
+                x=dates,
+                y=df_clean['BB_lower'].to_numpy(),
+                mode='lines',
+                name='BB Lower',
+                line=dict(color='gray', width=1, dash='dash'),
+                fill='tonexty',
+                fillcolor='rgba(128,128,128,0.1)'
+            ),
+            row=1, col=1
+        )
+    
+    # Volume with colors based on price movement, compared in one vectorized pass
+    # (a list keeps Plotly on its fast path for string colors)
+    colors = np.where(close >= open_, 'green', 'red').tolist()
+    
+    fig.add_trace(
+        go.Bar(
+            x=dates,
+            y=volume,
+            name='Volume',
+            marker_color=colors,
+            opacity=0.7
+        ),
+        row=2, col=1
+    )
+    
+    # RSI
+    if 'RSI' in df_clean.columns:
+        fig.add_trace(
+            go.Scattergl(
+                x=dates,
+                y=df_clean['RSI'].to_numpy(),
+                mode='lines',
+                name='RSI',
+                line=dict(color='purple')
+            ),
+            row=3, col=1
+        )
+    
+    # RSI reference lines
+    fig.add_hline(y=70, line_dash="dash", line_color="red")
+    fig.add_hline(y=30, line_dash="dash", line_color="green")
+    
+    fig.update_layout(
+        title=f"{ticker} - Technical Analysis Chart" if ticker else "Technical Analysis Chart",
+        xaxis_rangeslider_visible=False,
+        height=800,
+        # Keep the user's zoom and pan across reruns of the same ticker
+        uirevision=ticker or 'ta'
+    )
+    
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _indicator_figures(_df, fingerprint):
+    """MACD, stochastic, RSI and volume figures for a frame, cached on the data fingerprint"""
+    dates = _plot_dates(_df['Date'])
+    
+    macd_fig = go.Figure()
+    macd_fig.add_trace(go.Scattergl(x=dates, y=_df['MACD'].to_numpy(), name='MACD', line=dict(color='blue')))
+    macd_fig.add_trace(go.Scattergl(x=dates, y=_df['MACD_signal'].to_numpy(), name='Signal', line=dict(color='red')))
+    macd_fig.add_trace(go.Bar(x=dates, y=_df['MACD_histogram'].to_numpy(), name='Histogram', marker_color='green'))
+    macd_fig.update_layout(title="MACD", height=300, uirevision='ta')
+    
+    stoch_fig = go.Figure()
+    stoch_fig.add_trace(go.Scattergl(x=dates, y=_df['Stoch_K'].to_numpy(), name='%K', line=dict(color='blue')))
+    stoch_fig.add_trace(go.Scattergl(x=dates, y=_df['Stoch_D'].to_numpy(), name='%D', line=dict(color='red')))
+    stoch_fig.add_hline(y=80, line_dash="dash", line_color="red")
+    stoch_fig.add_hline(y=20, line_dash="dash", line_color="green")
+    stoch_fig.update_layout(title="Stochastic Oscillator", height=300, uirevision='ta')
+    
+    rsi_fig = go.Figure()
+    rsi_fig.add_trace(go.Scattergl(x=dates, y=_df['RSI'].to_numpy(), name='RSI', line=dict(color='purple')))
+    rsi_fig.add_hline(y=70, line_dash="dash", line_color="red")
+    rsi_fig.add_hline(y=30, line_dash="dash", line_color="green")
+    rsi_fig.update_layout(title="RSI (14-day)", height=300, uirevision='ta')
+    
+    volume_fig = go.Figure()
+    volume_fig.add_trace(go.Bar(x=dates, y=_df['Volume'].to_numpy(), name='Volume', marker_color='lightblue'))
+    volume_fig.add_trace(go.Scattergl(x=dates, y=_df['Volume_SMA'].to_numpy(), name='Volume SMA', line=dict(color='red')))
+    volume_fig.update_layout(title="Volume with SMA", height=300, uirevision='ta')
+    
+    return macd_fig, stoch_fig, rsi_fig, volume_fig
+
+# Last computed history per ticker with its running indicator state, so a history that only
+# gained bars at the end is extended in O(new bars) instead of recomputed
+_INDICATOR_STATES = OrderedDict()
+_INDICATOR_STATES_SIZE = 8
+_indicator_states_lock = threading.Lock()
+
+def _incremental_indicators(ticker, arrays):
+    """Indicator columns for a ticker's arrays, extending the previous result when they only grew"""
+    with _indicator_states_lock:
+        previous = _INDICATOR_STATES.get(ticker)
+    
+    columns = None
+    if previous is not None:
+        prev_arrays, prev_columns, state = previous
+        prev_len = len(prev_arrays[0])
+        if len(arrays[0]) >= prev_len and all(np.array_equal(new[:prev_len], old) for new, old in zip(arrays, prev_arrays)):
+            if len(arrays[0]) == prev_len:
+                columns = prev_columns
+            elif state is not None:
+                state, tail = ta_incremental.extend(state, *(values[prev_len:] for values in arrays))
+                columns = {name: np.concatenate((prev_columns[name], tail[name])) for name in prev_columns}
+    
+    if columns is None:
+        columns = _compute_indicators(*(values.tobytes() for values in arrays))
+        state = ta_incremental.seed(*arrays, columns)
+    
+    with _indicator_states_lock:
+        _INDICATOR_STATES[ticker] = (arrays, columns, state)
+        _INDICATOR_STATES.move_to_end(ticker)
+        if len(_INDICATOR_STATES) > _INDICATOR_STATES_SIZE:
+            _INDICATOR_STATES.popitem(last=False)
+    return columns
 
 class TechnicalAnalysis:
     def __init__(self):
@@ -19,8 +314,8 @@ class TechnicalAnalysis:
         if ticker:
             st.subheader(f"Technical Analysis for {ticker}")
         
-        # Calculate technical indicators
-        df_with_indicators = self.calculate_indicators(df.copy())
+        # Calculate technical indicators; they come back on a new frame, so the caller's df needs no copy
+        df_with_indicators = self.calculate_indicators(df, ticker)
         
         # Display tabs for different analyses
         tab1, tab2, tab3, tab4 = st.tabs(["Price Chart", "Indicators", "Signals", "Summary"])
@@ -37,36 +332,17 @@ class TechnicalAnalysis:
         with tab4:
             self.display_summary(df_with_indicators)
     
-    @st.cache_data
-    def calculate_indicators(_self, df):
+    def calculate_indicators(self, df, ticker=None):
         """Calculate various technical indicators"""
-        # Moving Averages
-        df['SMA_20'] = ta.trend.sma_indicator(df['Close'], window=20)
-        df['SMA_50'] = ta.trend.sma_indicator(df['Close'], window=50)
-        df['EMA_12'] = ta.trend.ema_indicator(df['Close'], window=12)
-        df['EMA_26'] = ta.trend.ema_indicator(df['Close'], window=26)
-        
-        # RSI
-        df['RSI'] = ta.momentum.rsi(df['Close'], window=14)
-        
-        # MACD
-        df['MACD'] = ta.trend.macd(df['Close'])
-        df['MACD_signal'] = ta.trend.macd_signal(df['Close'])
-        df['MACD_histogram'] = ta.trend.macd_diff(df['Close'])
-        
-        # Bollinger Bands
-        df['BB_upper'] = ta.volatility.bollinger_hband(df['Close'])
-        df['BB_middle'] = ta.volatility.bollinger_mavg(df['Close'])
-        df['BB_lower'] = ta.volatility.bollinger_lband(df['Close'])
-        
-        # Volume indicators - calculate simple moving average manually
-        df['Volume_SMA'] = df['Volume'].rolling(window=20).mean()
-        
-        # Stochastic Oscillator
-        df['Stoch_K'] = ta.momentum.stoch(df['High'], df['Low'], df['Close'])
-        df['Stoch_D'] = ta.momentum.stoch_signal(df['High'], df['Low'], df['Close'])
-        
-        return df
+        arrays = [df[col].to_numpy(np.float64) for col in OHLCV_INPUTS]
+        if ticker:
+            columns = _incremental_indicators(ticker, arrays)
+        else:
+            # Hand the cache raw float64 bytes so Streamlit keys on them instead of hashing the whole frame
+            columns = _compute_indicators(*(values.tobytes() for values in arrays))
+        # Attach the indicators as float32: display needs at most four decimals, and it halves
+        # the bytes every later pass, cache entry and chart touches (prices stay float64)
+        return df.assign(**{name: values.astype(np.float32) for name, values in columns.items()})
     
     def display_candlestick_chart(self, df, ticker):
         st.subheader("Candlestick Chart with Moving Averages")
@@ -75,202 +351,42 @@ class TechnicalAnalysis:
         if df.empty or len(df) < 2:
             st.warning("Not enough data to generate charts. Please try a different ticker or time period.")
             return
-            
-        # More thorough data cleaning to prevent infinite extent warnings
-        df_clean = df.copy()
-        
-        # Remove infinite values
-        df_clean = df_clean.replace([np.inf, -np.inf], np.nan)
-        
-        # Ensure Date column is datetime
-        if not pd.api.types.is_datetime64_any_dtype(df_clean['Date']):
-            df_clean['Date'] = pd.to_datetime(df_clean['Date'])
         
-        # Ensure numeric columns are properly typed
-        numeric_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
-        for col in numeric_cols:
-            if col in df_clean.columns:
-                df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
-        
-        # Remove rows with any missing essential data
-        df_clean = df_clean.dropna(subset=['Date', 'Open', 'High', 'Low', 'Close', 'Volume'])
-        
-        # Additional validation - ensure logical price relationships
-        df_clean = df_clean[
-            (df_clean['High'] >= df_clean['Low']) & 
-            (df_clean['High'] >= df_clean['Open']) & 
-            (df_clean['High'] >= df_clean['Close']) &
-            (df_clean['Low'] <= df_clean['Open']) & 
-            (df_clean['Low'] <= df_clean['Close']) &
-            (df_clean['Volume'] >= 0) &
-            (df_clean['Open'] > 0) & (df_clean['High'] > 0) & 
-            (df_clean['Low'] > 0) & (df_clean['Close'] > 0)
-        ]
-        
-        if df_clean.empty:
+        # The figure is built once per data fingerprint, so tab switches and reruns skip rebuilding it
+        fig = _candlestick_figure(df, ticker, _frame_fingerprint(df))
+        if fig is None:
             st.warning("No valid price data available after cleaning.")
             return
         
-        # Sort by date for proper chronological order
-        df_clean = df_clean.sort_values('Date').reset_index(drop=True)
-        
-        # Create subplot figure
-        fig = make_subplots(
-            rows=3, cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.05,
-            row_heights=[0.6, 0.2, 0.2],
-            subplot_titles=('Price', 'Volume', 'RSI')
-        )
-        
-        # Candlestick chart
-        fig.add_trace(
-            go.Candlestick(
-                x=df_clean['Date'],
-                open=df_clean['Open'],
-                high=df_clean['High'],
-                low=df_clean['Low'],
-                close=df_clean['Close'],
-                name='Price'
-            ),
-            row=1, col=1
-        )
-        
-        # Moving averages
-        if 'SMA_20' in df_clean.columns:
-            fig.add_trace(
-                go.Scatter(
-                    x=df_clean['Date'],
-                    y=df_clean['SMA_20'],
-                    mode='lines',
-                    name='SMA 20',
-                    line=dict(color='orange', width=1)
-                ),
-                row=1, col=1
-            )
-        
-        if 'SMA_50' in df_clean.columns:
-            fig.add_trace(
-                go.Scatter(
-                    x=df_clean['Date'],
-                    y=df_clean['SMA_50'],
-                    mode='lines',
-                    name='SMA 50',
-                    line=dict(color='blue', width=1)
-                ),
-                row=1, col=1
-            )
-        
-        # Bollinger Bands
-        if 'BB_upper' in df_clean.columns and 'BB_lower' in df_clean.columns:
-            fig.add_trace(
-                go.Scatter(
-                    x=df_clean['Date'],
-                    y=df_clean['BB_upper'],
-                    mode='lines',
-                    name='BB Upper',
-                    line=dict(color='gray', width=1, dash='dash')
-                ),
-                row=1, col=1
-            )
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=df_clean['Date'],
-                    y=df_clean['BB_lower'],
-                    mode='lines',
-                    name='BB Lower',
-                    line=dict(color='gray', width=1, dash='dash'),
-                    fill='tonexty',
-                    fillcolor='rgba(128,128,128,0.1)'
-                ),
-                row=1, col=1
-            )
-        
-        # Volume with colors based on price movement
-        colors = ['green' if close >= open else 'red' 
-                 for close, open in zip(df_clean['Close'], df_clean['Open'])]
-        
-        fig.add_trace(
-            go.Bar(
-                x=df_clean['Date'],
-                y=df_clean['Volume'],
-                name='Volume',
-                marker_color=colors,
-                opacity=0.7
-            ),
-            row=2, col=1
-        )
-        
-        # RSI
-        if 'RSI' in df_clean.columns:
-            fig.add_trace(
-                go.Scatter(
-                    x=df_clean['Date'],
-                    y=df_clean['RSI'],
-                    mode='lines',
-                    name='RSI',
-                    line=dict(color='purple')
-                ),
-                row=3, col=1
-            )
-        
-        # RSI reference lines
-        fig.add_hline(y=70, line_dash="dash", line_color="red")
-        fig.add_hline(y=30, line_dash="dash", line_color="green")
-        
-        fig.update_layout(
-            title=f"{ticker} - Technical Analysis Chart" if ticker else "Technical Analysis Chart",
-            xaxis_rangeslider_visible=False,
-            height=800
-        )
-        
         st.plotly_chart(fig, use_container_width=True)
     
     def display_indicators(self, df):
         st.subheader("Technical Indicators")
         
+        macd_fig, stoch_fig, rsi_fig, volume_fig = _indicator_figures(df, _frame_fingerprint(df))
+        
         col1, col2 = st.columns(2)
         
         with col1:
             st.write("**MACD**")
-            macd_fig = go.Figure()
-            macd_fig.add_trace(go.Scatter(x=df['Date'], y=df['MACD'], name='MACD', line=dict(color='blue')))
-            macd_fig.add_trace(go.Scatter(x=df['Date'], y=df['MACD_signal'], name='Signal', line=dict(color='red')))
-            macd_fig.add_trace(go.Bar(x=df['Date'], y=df['MACD_histogram'], name='Histogram', marker_color='green'))
-            macd_fig.update_layout(title="MACD", height=300)
             st.plotly_chart(macd_fig, use_container_width=True)
             
             st.write("**Stochastic Oscillator**")
-            stoch_fig = go.Figure()
-            stoch_fig.add_trace(go.Scatter(x=df['Date'], y=df['Stoch_K'], name='%K', line=dict(color='blue')))
-            stoch_fig.add_trace(go.Scatter(x=df['Date'], y=df['Stoch_D'], name='%D', line=dict(color='red')))
-            stoch_fig.add_hline(y=80, line_dash="dash", line_color="red")
-            stoch_fig.add_hline(y=20, line_dash="dash", line_color="green")
-            stoch_fig.update_layout(title="Stochastic Oscillator", height=300)
             st.plotly_chart(stoch_fig, use_container_width=True)
         
         with col2:
             st.write("**RSI**")
-            rsi_fig = go.Figure()
-            rsi_fig.add_trace(go.Scatter(x=df['Date'], y=df['RSI'], name='RSI', line=dict(color='purple')))
-            rsi_fig.add_hline(y=70, line_dash="dash", line_color="red")
-            rsi_fig.add_hline(y=30, line_dash="dash", line_color="green")
-            rsi_fig.update_layout(title="RSI (14-day)", height=300)
             st.plotly_chart(rsi_fig, use_container_width=True)
             
             st.write("**Volume Analysis**")
-            volume_fig = go.Figure()
-            volume_fig.add_trace(go.Bar(x=df['Date'], y=df['Volume'], name='Volume', marker_color='lightblue'))
-            volume_fig.add_trace(go.Scatter(x=df['Date'], y=df['Volume_SMA'], name='Volume SMA', line=dict(color='red')))
-            volume_fig.update_layout(title="Volume with SMA", height=300)
             st.plotly_chart(volume_fig, use_container_width=True)
     
     def display_signals(self, df):
         st.subheader("Trading Signals")
         
-        # Get latest values
-        latest = df.iloc[-1]
+        # Get latest values, unpacked once instead of a label lookup per check
+        (close, sma_20, sma_50, rsi_value, macd_value, macd_signal, stoch_k,
+         bb_upper, bb_lower, volume, volume_sma) = df.iloc[-1][LATEST_COLUMNS].to_numpy(np.float64)
         
         col1, col2, col3 = st.columns(3)
         
@@ -278,17 +394,17 @@ class TechnicalAnalysis:
             st.write("**Trend Signals**")
             
             # Moving Average Signal
-            if latest['Close'] > latest['SMA_20'] > latest['SMA_50']:
+            if close > sma_20 > sma_50:
                 st.success("🟢 Bullish - Price above both SMA 20 & 50")
-            elif latest['Close'] < latest['SMA_20'] < latest['SMA_50']:
+            elif close < sma_20 < sma_50:
                 st.error("🔴 Bearish - Price below both SMA 20 & 50")
             else:
                 st.warning("🟡 Mixed - Consolidating")
             
             # Bollinger Bands Signal
-            if latest['Close'] > latest['BB_upper']:
+            if close > bb_upper:
                 st.info("🔵 Price above upper Bollinger Band - Potentially overbought")
-            elif latest['Close'] < latest['BB_lower']:
+            elif close < bb_lower:
                 st.info("🔵 Price below lower Bollinger Band - Potentially oversold")
             else:
                 st.info("🔵 Price within Bollinger Bands - Normal range")
@@ -297,7 +413,6 @@ class TechnicalAnalysis:
             st.write("**Momentum Signals**")
             
             # RSI Signal
-            rsi_value = latest['RSI']
             if rsi_value > 70:
                 st.error(f"🔴 RSI Overbought: {rsi_value:.1f}")
             elif rsi_value < 30:
@@ -306,7 +421,6 @@ class TechnicalAnalysis:
                 st.info(f"🔵 RSI Neutral: {rsi_value:.1f}")
             
             # Stochastic Signal
-            stoch_k = latest['Stoch_K']
             if stoch_k > 80:
                 st.error(f"🔴 Stochastic Overbought: {stoch_k:.1f}")
             elif stoch_k < 20:
@@ -317,16 +431,13 @@ class TechnicalAnalysis:
         with col3:
             st.write("**MACD Signals**")
             
-            macd_value = latest['MACD']
-            macd_signal = latest['MACD_signal']
-            
             if macd_value > macd_signal:
                 st.success("🟢 MACD above signal line - Bullish")
             else:
                 st.error("🔴 MACD below signal line - Bearish")
             
             # Volume Signal
-            volume_ratio = latest['Volume'] / latest['Volume_SMA']
+            volume_ratio = volume / volume_sma
             if volume_ratio > 1.5:
                 st.info(f"🔵 High Volume: {volume_ratio:.1f}x average")
             elif volume_ratio < 0.5:
@@ -337,46 +448,15 @@ class TechnicalAnalysis:
     def display_summary(self, df):
         st.subheader("Technical Analysis Summary")
         
-        latest = df.iloc[-1]
+        # Calculate overall score from the latest scalars, read out in one conversion
+        close, sma_20, sma_50, rsi, macd, macd_signal, stoch_k, *_ = df.iloc[-1][LATEST_COLUMNS].to_numpy(np.float64)
         
-        # Calculate overall score
-        bullish_signals = 0
-        bearish_signals = 0
-        total_signals = 0
-        
-        # Price vs MA
-        if latest['Close'] > latest['SMA_20']:
-            bullish_signals += 1
-        else:
-            bearish_signals += 1
-        total_signals += 1
-        
-        if latest['Close'] > latest['SMA_50']:
-            bullish_signals += 1
-        else:
-            bearish_signals += 1
-        total_signals += 1
-        
-        # RSI
-        if latest['RSI'] < 30:
-            bullish_signals += 1
-        elif latest['RSI'] > 70:
-            bearish_signals += 1
-        total_signals += 1
-        
-        # MACD
-        if latest['MACD'] > latest['MACD_signal']:
-            bullish_signals += 1
-        else:
-            bearish_signals += 1
-        total_signals += 1
-        
-        # Stochastic
-        if latest['Stoch_K'] < 20:
-            bullish_signals += 1
-        elif latest['Stoch_K'] > 80:
-            bearish_signals += 1
-        total_signals += 1
+        # Price vs MA, RSI, MACD and Stochastic; the MA and MACD checks always pick a side,
+        # RSI and Stochastic only count outside their neutral band
+        above = np.array([close > sma_20, close > sma_50, macd > macd_signal])
+        bullish_signals = int(above.sum()) + int(rsi < 30) + int(stoch_k < 20)
+        bearish_signals = int((~above).sum()) + int(rsi > 70) + int(stoch_k > 80)
+        total_signals = 5
         
         # Display summary
         col1, col2, col3 = st.columns(3)
@@ -388,35 +468,30 @@ class TechnicalAnalysis:
             st.metric("Bearish Signals", f"{bearish_signals}/{total_signals}")
         
         with col3:
-            if bullish_signals > bearish_signals:
-                sentiment = "🟢 BULLISH"
-            elif bearish_signals > bullish_signals:
-                sentiment = "🔴 BEARISH"
-            else:
-                sentiment = "🟡 NEUTRAL"
+            sentiment = SENTIMENT_LABELS[int(np.sign(bullish_signals - bearish_signals)) + 1]
             st.metric("Overall Sentiment", sentiment)
         
         # Key metrics table
         st.write("**Key Metrics**")
-        metrics_df = pd.DataFrame({
-            'Indicator': ['Current Price', 'SMA 20', 'SMA 50', 'RSI', 'MACD', 'Stochastic %K'],
-            'Value': [
-                f"${latest['Close']:.2f}",
-                f"${latest['SMA_20']:.2f}",
-                f"${latest['SMA_50']:.2f}",
-                f"{latest['RSI']:.1f}",
-                f"{latest['MACD']:.4f}",
-                f"{latest['Stoch_K']:.1f}"
-            ]
-        })
+        metrics_df = pd.DataFrame.from_records((
+            ('Current Price', f"${close:.2f}"),
+            ('SMA 20', f"${sma_20:.2f}"),
+            ('SMA 50', f"${sma_50:.2f}"),
+            ('RSI', f"{rsi:.1f}"),
+            ('MACD', f"{macd:.4f}"),
+            ('Stochastic %K', f"{stoch_k:.1f}")
+        ), columns=['Indicator', 'Value'])
         st.dataframe(metrics_df, use_container_width=True)
         
         # Export functionality
         if st.button("📥 Export Technical Analysis Data"):
-            csv = df.to_csv(index=False)
+            # Write the CSV in chunks straight into a compressed buffer instead of one big string
+            compression, extension, mime = EXPORT_COMPRESSION
+            buffer = io.BytesIO()
+            df.to_csv(buffer, index=False, chunksize=10000, compression=compression)
             st.download_button(
                 label="Download CSV",
-                data=csv,
-                file_name=f"technical_analysis_{latest['Date'].strftime('%Y%m%d')}.csv",
-                mime="text/csv"
+                data=buffer.getvalue(),
+                file_name=f"technical_analysis_{df['Date'].iloc[-1].strftime('%Y%m%d')}.csv.{extension}",
+                mime=mime
             )
@@ -1,21 +1,34 @@
 import streamlit as st
+import math
 import re
+from functools import lru_cache
 
+# Basic ticker validation: alphanumeric, 1-10 characters, allow dots and hyphens
+_TICKER_RE = re.compile(r'[A-Z0-9.-]{1,10}')
+
+# (divisor, suffix) per power of one thousand, as used by format_currency
+_CURRENCY_SUFFIXES = ((1, ""), (1e3, "K"), (1e6, "M"), (1e9, "B"), (1e12, "T"))
+
+@lru_cache(maxsize=1024)
 def format_currency(amount):
     """Format large currency amounts with appropriate suffixes"""
     if amount == 0 or amount is None:
         return "$0"
     
-    if abs(amount) >= 1e12:
-        return f"${amount/1e12:.2f}T"
-    elif abs(amount) >= 1e9:
-        return f"${amount/1e9:.2f}B"
-    elif abs(amount) >= 1e6:
-        return f"${amount/1e6:.2f}M"
-    elif abs(amount) >= 1e3:
-        return f"${amount/1e3:.2f}K"
-    else:
+    # Index the suffix table by the thousands exponent instead of walking a comparison ladder
+    magnitude = abs(amount)
+    try:
+        index = min(int(math.log10(magnitude)) // 3, 4) if magnitude >= 1 else 0
+    except OverflowError:
+        index = 4  # Infinity
+    # log10 can round up to the next power of ten just below it
+    if index and magnitude < _CURRENCY_SUFFIXES[index][0]:
+        index -= 1
+    
+    divisor, suffix = _CURRENCY_SUFFIXES[index]
+    if divisor == 1:
         return f"${amount:.2f}"
+    return f"${amount/divisor:.2f}{suffix}"
 
 def safe_divide(numerator, denominator):
     """Safely divide two numbers, returning 0 if denominator is 0"""
@@ -28,12 +41,11 @@ def safe_divide(numerator, denominator):
 
 def validate_ticker(ticker):
     """Validate ticker symbol format"""
-    if not ticker:
+    # Reject empty and overlong input before running the regex
+    if not ticker or len(ticker) > 10:
         return False
     
-    # Basic validation: alphanumeric, 1-10 characters, allow dots and hyphens
-    pattern = r'^[A-Z0-9.-]{1,10}$'
-    return bool(re.match(pattern, ticker.upper()))
+    return _TICKER_RE.fullmatch(ticker.upper()) is not None
 
 def format_percentage(value, decimal_places=2):
     """Format percentage values"""
@@ -77,22 +89,24 @@ def get_color_for_value(value, reverse=False):
     else:
         return "green" if value > 0 else "red"
 
-@st.cache_data
+# The dates are relative to now, so let the cached frame age out
+@st.cache_data(ttl=3600)
 def load_sample_data():
     """Load sample stock data for demonstration"""
+    import numpy as np
     import pandas as pd
-    from datetime import datetime, timedelta
     
     # This is just for demonstration - in practice, always use real data
-    dates = [datetime.now() - timedelta(days=x) for x in range(30, 0, -1)]
+    dates = pd.date_range(end=pd.Timestamp.now() - pd.Timedelta(days=1), periods=30, freq='D')
+    steps = np.arange(30)
     
     sample_data = {
         'Date': dates,
-        'Open': [100 + i*0.5 for i in range(30)],
-        'High': [102 + i*0.5 for i in range(30)],
-        'Low': [98 + i*0.5 for i in range(30)],
-        'Close': [101 + i*0.5 for i in range(30)],
-        'Volume': [1000000 + i*10000 for i in range(30)]
+        'Open': 100 + steps * 0.5,
+        'High': 102 + steps * 0.5,
+        'Low': 98 + steps * 0.5,
+        'Close': 101 + steps * 0.5,
+        'Volume': 1000000 + steps * 10000
     }
     
     return pd.DataFrame(sample_data)
@@ -113,6 +127,19 @@ def display_error_message(error_type, details=""):
     
     st.error(full_message)
 
+def display_dataframe_quickly(df, max_rows=5000, key=None, **st_dataframe_kwargs):
+    """Display a dataframe, serializing at most max_rows rows at a time"""
+    n_rows = len(df)
+    
+    if n_rows <= max_rows:
+        st.dataframe(df, **st_dataframe_kwargs)
+        return
+    
+    start_row = st.slider("Start row", 0, n_rows - max_rows, key=key)
+    end_row = start_row + max_rows
+    st.dataframe(df.iloc[start_row:end_row], **st_dataframe_kwargs)
+    st.caption(f"Displaying rows {start_row} to {end_row - 1} of {n_rows}.")
+
 def validate_data_completeness(df, required_columns=None):
     """Validate data completeness and quality"""
     if required_columns is None:
@@ -125,12 +152,10 @@ def validate_data_completeness(df, required_columns=None):
     if missing_cols:
         issues.append(f"Missing columns: {', '.join(missing_cols)}")
     
-    # Check for missing data
-    for col in required_columns:
-        if col in df.columns:
-            missing_count = df[col].isna().sum()
-            if missing_count > 0:
-                issues.append(f"{col}: {missing_count} missing values")
+    # Check for missing data, counting every present column in one reduction
+    present_cols = [col for col in required_columns if col in df.columns]
+    na_counts = df[present_cols].isna().sum()
+    issues += [f"{col}: {count} missing values" for col, count in na_counts.items() if count > 0]
     
     # Check data types
     import pandas as pd
@@ -141,14 +166,15 @@ def validate_data_completeness(df, required_columns=None):
     
     # Check logical consistency
     if all(col in df.columns for col in ['High', 'Low', 'Open', 'Close']):
-        inconsistent = df[
-            (df['High'] < df['Low']) |
-            (df['High'] < df['Open']) |
-            (df['High'] < df['Close']) |
-            (df['Low'] > df['Open']) |
-            (df['Low'] > df['Close'])
-        ]
-        if not inconsistent.empty:
-            issues.append(f"{len(inconsistent)} rows with inconsistent price data")
+        # Combine the comparisons in place on raw arrays instead of building a Series per condition
+        open_, high, low, close = (df[col].to_numpy() for col in ['Open', 'High', 'Low', 'Close'])
+        inconsistent = high < low
+        inconsistent |= high < open_
+        inconsistent |= high < close
+        inconsistent |= low > open_
+        inconsistent |= low > close
+        inconsistent_count = int(inconsistent.sum())
+        if inconsistent_count:
+            issues.append(f"{inconsistent_count} rows with inconsistent price data")
     
     return issues